@@ -1,8 +1,27 @@
+import functools
+
 from crewai import LLM  # type: ignore[import-not-found]
 from crewai import Agent, Crew, Process, Task  # type: ignore[import-not-found]
 from crewai.project import CrewBase, agent, crew, task  # type: ignore[import-not-found]
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_llm() -> LLM:
+    """
+    Both agents use the same model and settings, so they share one LLM client
+    (and its HTTP session) across agents and crew instances. It is built on
+    first use, not at import: the voice CLI and the Streamlit app import this
+    module but never run a crew.
+    """
+    return LLM(
+        # Llama 3.x ~7–8B Instruct via OpenRouter (larger than 3B for better quality)
+        # OpenRouter model ID:
+        #   meta-llama/llama-3.1-8b-instruct
+        model="openrouter/meta-llama/llama-3.1-8b-instruct",
+        temperature=0.7,
+    )
+
+
 @CrewBase
 class VoiceInterviewPracticeSystemCrew:
     """VoiceInterviewPracticeSystem crew"""
@@ -19,13 +38,7 @@ class VoiceInterviewPracticeSystemCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                # Llama 3.x ~7–8B Instruct via OpenRouter (larger than 3B for better quality)
-                # OpenRouter model ID:
-                #   meta-llama/llama-3.1-8b-instruct
-                model="openrouter/meta-llama/llama-3.1-8b-instruct",
-                temperature=0.7,
-            ),
+            llm=_shared_llm(),
         )
 
     @agent
@@ -40,13 +53,7 @@ class VoiceInterviewPracticeSystemCrew:
             max_iter=25,
             max_rpm=None,
             max_execution_time=None,
-            llm=LLM(
-                # Llama 3.x ~7–8B Instruct via OpenRouter (larger than 3B for better quality)
-                # OpenRouter model ID:
-                #   meta-llama/llama-3.1-8b-instruct
-                model="openrouter/meta-llama/llama-3.1-8b-instruct",
-                temperature=0.7,
-            ),
+            llm=_shared_llm(),
         )
 
     @task
@@ -1,20 +1,33 @@
 #!/usr/bin/env python
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import os
 import sys
 import subprocess
 import platform
+import re
+import signal
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import httpx
+import numpy as np
+import orjson
 import sounddevice as sd
 import soundfile as sf
 from dotenv import load_dotenv
 from gtts import gTTS
-from openai import OpenAI
-import whisper
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from openai import AsyncOpenAI, OpenAI
 import yaml
 import time
 
@@ -24,6 +37,18 @@ try:  # pragma: no cover - playsound is optional and may not be installed
 except Exception:  # pragma: no cover
     playsound = None  # type: ignore[assignment]
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+# Optional webrtcvad support: if available, used to detect the end of an answer.
+try:  # pragma: no cover - webrtcvad is optional and may not be installed
+    import webrtcvad  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover
+    webrtcvad = None  # type: ignore[assignment]
+
 from voice_interview_practice_system.crew import VoiceInterviewPracticeSystemCrew
 
 # Load environment variables from .env file if it exists
@@ -33,28 +58,111 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = BASE_DIR / "config"
 SESSIONS_DIR = BASE_DIR.parent / "sessions"
+TTS_CACHE_DIR = Path.home() / ".cache" / "voice_interview" / "tts"
+_SYSTEM = platform.system()
+
+# From this turn on, the coach analysis is started speculatively while the
+# user decides whether to continue, so quitting does not wait on a cold call.
+SPECULATIVE_COACH_MIN_TURNS = 4
 
 
 def _ensure_sessions_dir() -> None:
     SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
+# Anything that is not a word character (str.isalnum() or "_") or "-".
+_SAFE_NAME_RE = re.compile(r"[^\w-]")
+# Same mapping for ASCII, as a C-level translate table.
+_SAFE_NAME_TABLE = str.maketrans(
+    {chr(i): "_" for i in range(128) if not (chr(i).isalnum() or chr(i) in "-_")}
+)
+
+
+# Longest name prefix kept in session filenames.
+_SAFE_NAME_MAX_LEN = 64
+
+
+def _safe_session_name(user_name: str) -> str:
+    """Sanitize a user name for use in a session filename (at most 64 characters)."""
+    user_name = user_name[:_SAFE_NAME_MAX_LEN]
+    if user_name.isascii():
+        return user_name.translate(_SAFE_NAME_TABLE)
+    # Non-ASCII letters stay allowed, so fall back to the Unicode-aware regex.
+    return _SAFE_NAME_RE.sub("_", user_name)
+
+
+def _session_turns_path(session_path: Path) -> Path:
+    """Append-only JSONL log holding one qa_list entry per line."""
+    return session_path.with_suffix(".qa.jsonl")
+
+
+def _append_session_turn(session_path: Path, qa_entry: Dict[str, Any]) -> None:
+    """Append a single Q&A entry to the session's JSONL log (O(1) per turn)."""
+    with _session_turns_path(session_path).open("ab") as f:
+        f.write(orjson.dumps(qa_entry) + b"\n")
+
+
+def _write_session_json(session_path: Path, session_data: Dict[str, Any]) -> None:
+    """Write the full, human-readable session JSON."""
+    session_path.write_bytes(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlSafeLoader)
 
 
-def _play_audio_file(filepath: Path) -> bool:
+def _load_session(session_path: Path) -> Dict[str, Any]:
+    """
+    Load a saved session, taking qa_list from the JSONL turn log when present
+    (the log is appended every turn, the JSON only at specific points).
     """
-    Play an audio file.
-    - First try playsound (if installed and working)
+    session_data: Dict[str, Any] = orjson.loads(session_path.read_bytes())
+    turns_path = _session_turns_path(session_path)
+    if turns_path.exists():
+        session_data["qa_list"] = [
+            orjson.loads(line) for line in turns_path.read_bytes().splitlines() if line.strip()
+        ]
+    return session_data
+
+
+def _load_recent_sessions(limit: int) -> List[Dict[str, Any]]:
+    """Load the `limit` most recently modified sessions that contain answers."""
+    if not SESSIONS_DIR.exists():
+        return []
+    paths = sorted(SESSIONS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    sessions: List[Dict[str, Any]] = []
+    for path in paths:
+        try:
+            session_data = _load_session(path)
+        except (OSError, orjson.JSONDecodeError):
+            continue
+        if session_data.get("qa_list"):
+            sessions.append(session_data)
+        if len(sessions) >= limit:
+            break
+    return sessions
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Parse a YAML config, reusing the cached result until the file changes."""
+    return _parse_yaml(path, path.stat().st_mtime_ns)
+
+
+async def _aplay_audio_file(filepath: Path) -> bool:
+    """
+    Play an audio file without blocking the event loop.
+    - First try playsound (if installed and working) in a worker thread
     - Then fall back to OS-level mechanisms so audio is actually heard.
     Returns True if playback was triggered, False otherwise.
     """
+    filepath_str = str(filepath)
+
     # 1) Try in-process playback with playsound if available
     if playsound is not None:  # pragma: no cover - optional / env-dependent
         try:
-            playsound(str(filepath))
+            await asyncio.to_thread(playsound, filepath_str)
             return True
         except Exception:
             # Fall through to OS-level playback
@@ -62,35 +170,30 @@ def _play_audio_file(filepath: Path) -> bool:
 
     # 2) OS-level fallback
     try:
-        system = platform.system()
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             # Use os.startfile when available (Windows only)
             if hasattr(os, "startfile"):
-                os.startfile(str(filepath))  # type: ignore[attr-defined]
+                os.startfile(filepath_str)  # type: ignore[attr-defined]
                 return True
             # Fallback to PowerShell Start-Process
-            subprocess.run(
-                [
-                    "powershell",
-                    "-Command",
-                    f'Start-Process \"{str(filepath)}\"',
-                ],
-                check=False,
+            proc = await asyncio.create_subprocess_exec(
+                "powershell",
+                "-Command",
+                f'Start-Process \"{filepath_str}\"',
             )
-            return True
-        elif system == "Darwin":
+        elif _SYSTEM == "Darwin":
             # macOS: use afplay
-            subprocess.run(["afplay", str(filepath)], check=False)
-            return True
+            proc = await asyncio.create_subprocess_exec("afplay", filepath_str)
         else:
             # Linux / others: try xdg-open
-            subprocess.run(["xdg-open", str(filepath)], check=False)
-            return True
+            proc = await asyncio.create_subprocess_exec("xdg-open", filepath_str)
+        await proc.wait()
+        return True
     except Exception:
         return False
 
 
-def _speed_up_tts_audio_if_possible(src: Path, speed: float = 1.2) -> Path:
+async def _aspeed_up_tts(src: Path, speed: float = 1.2) -> Path:
     """
     Use ffmpeg (if available) to slightly speed up the TTS audio for a more natural pace.
     Returns the path to the (possibly) processed file.
@@ -98,57 +201,145 @@ def _speed_up_tts_audio_if_possible(src: Path, speed: float = 1.2) -> Path:
     if speed <= 1.0:
         return src
 
-    # Reuse ffmpeg availability check used by Whisper
     if not _check_ffmpeg_available():
         return src
 
-    dst = src.with_name(src.stem + "_fast" + src.suffix)
+    # Always write to the temp dir: `src` may live in the persistent TTS cache.
+    dst = Path(tempfile.gettempdir()) / (src.stem + "_fast" + src.suffix)
     try:
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(src),
-                "-filter:a",
-                f"atempo={speed}",
-                str(dst),
-            ],
-            check=True,
-            capture_output=True,
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-y",
+            "-i",
+            str(src),
+            "-filter:a",
+            f"atempo={speed}",
+            str(dst),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
+        await proc.wait()
+        if proc.returncode != 0:
+            return src
         return dst
     except Exception:
         # If anything fails, fall back to the original audio
         return src
 
 
-def _speak_text_google_tts(text: str, filename: Optional[Path] = None) -> None:
+def _prime_input_device(sample_rate: int = 16_000, channels: int = 1) -> None:
+    """
+    Probe the default microphone with the recording format while the question
+    is being synthesized. This only validates the settings (failures are left
+    for the recording to report); no stream is opened or kept open.
+    """
+    try:
+        sd.check_input_settings(samplerate=sample_rate, channels=channels)
+    except Exception:
+        # Recording reports its own errors; the check is best-effort only.
+        pass
+
+
+def _play_mp3_bytes_in_process(mp3_bytes: bytes) -> bool:
+    """
+    Decode MP3 bytes in memory and play them through sounddevice at normal
+    speed. Nothing is written to disk and no player process is spawned.
+    Returns False if decoding or playback is unavailable (e.g. a libsndfile
+    build without MP3 support).
+    """
+    try:
+        samples, sample_rate = sf.read(BytesIO(mp3_bytes), dtype="float32")
+        sd.play(samples, samplerate=sample_rate)
+        sd.wait()
+        return True
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _tts_cache_path(text: str, lang: str = "en") -> Path:
+    key = hashlib.sha256(f"{lang}:{text}".encode("utf-8")).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
+
+
+def _synthesize_tts(text: str, lang: str = "en", cache: bool = False) -> bytes:
+    """
+    Return gTTS MP3 bytes for `text`.
+    With `cache=True` the on-disk cache is used, so stable phrases (persona
+    intro, confirmations) skip the network on later runs. Questions are
+    one-off and are not cached, which keeps the cache directory small.
+    """
+    cache_path = _tts_cache_path(text, lang)
+    if cache and cache_path.exists():
+        return cache_path.read_bytes()
+
+    buf = BytesIO()
+    gTTS(text=text, lang=lang, slow=False).write_to_fp(buf)
+    mp3_bytes = buf.getvalue()
+    if not cache:
+        return mp3_bytes
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file.
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(mp3_bytes)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+    return mp3_bytes
+
+
+async def _asynthesize_tts(text: str, cache: bool = False) -> bytes:
+    """Run the gTTS round-trip (see `_synthesize_tts`) in a worker thread and return MP3 bytes."""
+    return await asyncio.to_thread(_synthesize_tts, text, cache=cache)
+
+
+async def _aspeak_text_google_tts(
+    text: str,
+    filename: Optional[Path] = None,
+    synthesis: Optional["asyncio.Task[bytes]"] = None,
+    cache: bool = False,
+) -> None:
     """
     Use Google TTS (gTTS) to synthesize the interviewer question and play it.
+    The gTTS network round-trip runs concurrently with the microphone settings check.
+    `synthesis` may be an already-running `_asynthesize_tts(text)` task; pass
+    `cache=True` for stable phrases that should go through the on-disk TTS cache.
     """
     if not text:
         return
 
-    # Use a temp directory so question audio is not persisted in sessions
-    if filename is None:
-        tmp_dir = Path(tempfile.gettempdir())
-        # Use a unique file per call to avoid "Permission denied" if a previous
-        # player still has the file open.
-        ts = int(time.time() * 1000)
-        filename = tmp_dir / f"voice_interview_question_{ts}.mp3"
-
     try:
-        tts = gTTS(text=text, lang="en", slow=False)
-        tts.save(str(filename))
+        if synthesis is None:
+            synthesis = asyncio.create_task(_asynthesize_tts(text, cache=cache))
+        mp3_bytes, _ = await asyncio.gather(
+            synthesis,
+            asyncio.to_thread(_prime_input_device),
+        )
 
-        # Optionally speed up playback slightly for a more conversational pace
-        processed = _speed_up_tts_audio_if_possible(filename, speed=1.2)
+        played = False
+        if not await asyncio.to_thread(_check_ffmpeg_available):
+            # No pitch-preserving speed-up without ffmpeg, so play as-is in-process.
+            played = await asyncio.to_thread(_play_mp3_bytes_in_process, mp3_bytes)
 
-        # Try to play the audio
-        played = _play_audio_file(processed)
         if not played:
-            print(f"[INFO] Audio file saved to {filename} (could not play automatically)")
+            # Speed up the file with ffmpeg atempo when available (keeps the pitch) and play it.
+            if filename is None and cache and _tts_cache_path(text).exists():
+                # Play the cached file directly; nothing new to write.
+                filename = _tts_cache_path(text)
+            else:
+                if filename is None:
+                    tmp_dir = Path(tempfile.gettempdir())
+                    # Use a unique file per call to avoid "Permission denied" if a previous
+                    # player still has the file open.
+                    ts = int(time.time() * 1000)
+                    filename = tmp_dir / f"voice_interview_question_{ts}.mp3"
+                filename.write_bytes(mp3_bytes)
+
+            processed = await _aspeed_up_tts(filename, speed=1.2)
+            played = await _aplay_audio_file(processed)
+            if not played:
+                print(f"[INFO] Audio file saved to {filename} (could not play automatically)")
 
         # Always print the text as well
         print(f"[TEXT] {text}")
@@ -157,191 +348,471 @@ def _speak_text_google_tts(text: str, filename: Optional[Path] = None) -> None:
         print(f"[FALLBACK] Question (text only): {text}")
 
 
-def _record_audio_to_file(
-    filename: Path,
+# Energy threshold (int16 RMS) used to detect speech when webrtcvad is unavailable.
+_SPEECH_RMS_THRESHOLD = 500.0
+
+
+def _is_speech(vad: Optional[Any], frame: np.ndarray, sample_rate: int) -> bool:
+    if vad is not None:
+        return vad.is_speech(frame.tobytes(), sample_rate)
+    return float(np.sqrt(np.mean(frame.astype(np.float32) ** 2))) > _SPEECH_RMS_THRESHOLD
+
+
+async def _ainput(prompt: str = "") -> str:
+    """
+    `input()` for the event loop, read on a daemon thread.
+    A default-executor thread blocked in input() would keep asyncio.run() and
+    the interpreter from exiting after Ctrl+C; a daemon thread is abandoned.
+    """
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[str]" = loop.create_future()
+
+    def _resolve(line: Optional[str], error: Optional[Exception]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line or "")
+
+    def _read() -> None:
+        try:
+            line, error = input(prompt), None
+        except Exception as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve, line, error)
+        except RuntimeError:
+            # The loop has already closed (session aborted); nobody is waiting.
+            pass
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
+async def _await_record_start(duration_seconds: int = 90) -> None:
+    """Tell the user how recording works and wait until they press Enter."""
+    print(f"\nPress Enter to start recording (up to {duration_seconds} seconds)...")
+    print("(Recording stops after a short pause; press Ctrl+C to stop early)")
+    await _ainput()
+
+
+@contextlib.contextmanager
+def _sigint_sets(event: threading.Event) -> Iterator[None]:
+    """
+    While active, Ctrl+C sets `event` instead of raising KeyboardInterrupt.
+    Python only delivers SIGINT to the main thread, so this is how the event
+    loop stops a recording that runs in a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, event.set)
+        installed_on_loop = True
+    except NotImplementedError:
+        # Windows event loops have no add_signal_handler; a plain handler
+        # still runs on the main thread, which is the one running the loop.
+        signal.signal(signal.SIGINT, lambda signum, frame: event.set())
+        installed_on_loop = False
+    try:
+        yield
+    finally:
+        if installed_on_loop:
+            loop.remove_signal_handler(signal.SIGINT)
+        if previous is not None:
+            signal.signal(signal.SIGINT, previous)
+
+
+def _record_answer_audio(
     duration_seconds: int = 90,
     sample_rate: int = 16_000,
-    channels: int = 1,
-) -> bool:
+    silence_seconds: float = 1.5,
+    on_frame: Optional[Callable[[np.ndarray], None]] = None,
+    stop: Optional[threading.Event] = None,
+) -> Optional[np.ndarray]:
     """
-    Record audio from the default microphone into a WAV file.
-    Returns True on success, False if recording failed.
-    Supports early stopping with Ctrl+C.
+    Record audio from the default microphone into memory.
+    Returns a mono float32 array in [-1, 1] at `sample_rate` (ready for Whisper),
+    or None if recording failed.
+    Recording stops automatically after `silence_seconds` of silence following
+    speech, after `duration_seconds`, or early once `stop` is set (the CLI sets
+    it on Ctrl+C via `_sigint_sets`).
+    If given, `on_frame` receives each int16 frame as it is captured.
     """
-    import time
-    
-    print(f"\nPress Enter to start recording (up to {duration_seconds} seconds)...")
-    print("(Press Ctrl+C to stop recording early)")
-    input()
-    print("Recording... speak now. (Press Ctrl+C when done)")
-    
-    frames = None
+    print("Recording... speak now.")
+
+    # 20 ms frames: the frame size webrtcvad expects at 16 kHz.
+    frame_size = sample_rate * 20 // 1000
+    max_frames = duration_seconds * 1000 // 20
+    silence_limit = int(silence_seconds * 1000 / 20)
+
+    chunks: "deque[np.ndarray]" = deque()
+    finished = threading.Event()
+    # Set by the stream when it finishes on its own, or from outside to stop early.
+    if stop is None:
+        stop = threading.Event()
+
+    def _on_finished() -> None:
+        finished.set()
+        stop.set()
+    vad = webrtcvad.Vad(2) if webrtcvad is not None else None
+    heard_speech = False
+    silent_frames = 0
+    first_speech_frame = last_speech_frame = 0
+
+    def _on_audio(indata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+        nonlocal heard_speech, silent_frames, first_speech_frame, last_speech_frame
+        frame = indata[:, 0].copy()
+        chunks.append(frame)
+        if on_frame is not None:
+            on_frame(frame)
+        if _is_speech(vad, frame, sample_rate):
+            if not heard_speech:
+                first_speech_frame = len(chunks) - 1
+            heard_speech = True
+            last_speech_frame = len(chunks) - 1
+            silent_frames = 0
+        else:
+            silent_frames += 1
+        if len(chunks) >= max_frames or (heard_speech and silent_frames >= silence_limit):
+            raise sd.CallbackStop()
+
     try:
-        # Start recording in non-blocking mode
-        frames = sd.rec(
-            int(duration_seconds * sample_rate),
+        with sd.InputStream(
             samplerate=sample_rate,
-            channels=channels,
-            blocking=False,
-        )
-        
-        # Poll for completion - this allows Ctrl+C to interrupt
-        # Check if recording is still active by polling the stream status
-        try:
-            while True:
-                # Check if recording is done
-                if not sd.get_stream().active:
-                    break
-                # Small sleep allows Ctrl+C to be caught
-                time.sleep(0.1)
-        except (AttributeError, RuntimeError):
-            # Fallback: just wait for the full duration
-            # But use sleep in a loop so Ctrl+C can interrupt
-            elapsed = 0
-            while elapsed < duration_seconds:
-                time.sleep(0.1)
-                elapsed += 0.1
-        
-        # Recording completed normally
-        sf.write(str(filename), frames, sample_rate)
-        print(f"Recording saved to: {filename}")
-        return True
-        
-    except KeyboardInterrupt:
-        print("\n[INFO] Recording stopped by user.")
-        try:
-            # Stop the recording stream immediately
-            sd.stop()
-            
-            # Wait a brief moment for the stream to finish writing
-            time.sleep(0.3)
-            
-            # Save what we have so far
-            if frames is not None:
-                sf.write(str(filename), frames, sample_rate)
-                print(f"Partial recording saved to: {filename}")
-                return True
-        except Exception as e:
-            print(f"[WARN] Could not save partial recording: {e}")
-        return False
+            channels=1,
+            dtype="int16",
+            blocksize=frame_size,
+            callback=_on_audio,
+            finished_callback=_on_finished,
+        ):
+            stop.wait()
+            # Leaving the block closes the stream, which also ends an early stop.
+            if not finished.is_set():
+                print("\n[INFO] Recording stopped by user.")
     except Exception as e:
         print(f"[WARN] Audio recording failed: {e}")
-        try:
-            sd.stop()
-        except Exception:
-            pass
-        return False
+        return None
+
+    if not chunks:
+        return None
+    frames_to_keep: Any = chunks
+    if heard_speech:
+        # Trim leading/trailing silence (keeping 200 ms around the speech),
+        # so Whisper does not extract features for audio VAD would drop anyway.
+        pad = 10
+        frames_to_keep = list(chunks)[
+            max(0, first_speech_frame - pad) : last_speech_frame + pad + 1
+        ]
+    # int16 PCM -> float32 in [-1, 1], scaled in place to avoid a second copy.
+    audio = np.concatenate(frames_to_keep).astype(np.float32)
+    audio /= 32768.0
+    return audio
+
 
+_whisper_model: Optional[BatchedInferencePipeline] = None
+# Concurrent transcribe() calls the model can serve (one per Streamlit user / thread).
+WHISPER_NUM_WORKERS = 2
+# VAD-merged chunks of up to WHISPER_CHUNK_SECONDS are decoded WHISPER_BATCH_SIZE at a time.
+WHISPER_BATCH_SIZE = 24
+WHISPER_CHUNK_SECONDS = 30
+_whisper_model_lock = threading.Lock()
 
-_whisper_model: Optional["whisper.Whisper"] = None
+
+_ffmpeg_available: Optional[bool] = None
 
 
 def _check_ffmpeg_available() -> bool:
     """
     Check if ffmpeg is available in the system PATH.
-    Whisper requires ffmpeg to process audio files.
+    The CLI speeds up TTS playback with ffmpeg atempo; without it, questions
+    are played in-process at normal speed.
+    The probe runs once per process; later calls reuse the cached result.
+    """
+    global _ffmpeg_available
+    if _ffmpeg_available is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+                check=False,
+            )
+            _ffmpeg_available = result.returncode == 0
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            _ffmpeg_available = False
+    return _ffmpeg_available
+
+
+def _whisper_device() -> Tuple[str, str]:
+    """
+    Pick the CTranslate2 device and compute type for Whisper:
+    float16 on a CUDA GPU (tensor cores, half the weight bandwidth), INT8 on CPU.
+    The model is pinned to that device once when it is loaded.
+    """
+    try:
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", "float16"
+    except Exception:
+        pass
+    return "cpu", "int8"
+
+
+def _warm_up_whisper(model: WhisperModel) -> None:
+    """
+    Run one encoder/decoder pass on a second of silence so CUDA kernel
+    selection and buffer allocation happen at load time, not on turn 1.
+    VAD is disabled here, otherwise the silent input would skip the encoder.
     """
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
+        segments, _ = model.transcribe(
+            np.zeros(16_000, dtype=np.float32), vad_filter=False, beam_size=1
         )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+        for _ in segments:
+            pass
+    except Exception:
+        # Warm-up is an optimization only; real transcriptions report errors.
+        pass
 
 
-def _get_whisper_model() -> "whisper.Whisper":
+def _get_whisper_model() -> BatchedInferencePipeline:
     """
-    Load (or reuse) the local Whisper model for transcription.
+    Load (or reuse) the local faster-whisper model for transcription.
+    The model is wrapped in a BatchedInferencePipeline so VAD-segmented
+    chunks of an answer are decoded in batches, and it runs
+    WHISPER_NUM_WORKERS parallel workers so answers submitted at the same
+    time by different users do not queue behind each other.
     """
     global _whisper_model
     if _whisper_model is None:
-        # You can change 'base' to 'small', 'medium', etc. depending on your hardware
-        _whisper_model = whisper.load_model("base")
+        # A background preload may be running; wait for it instead of loading twice.
+        with _whisper_model_lock:
+            if _whisper_model is None:
+                device, compute_type = _whisper_device()
+                # You can change 'base' to 'small', 'medium', etc. depending on your hardware
+                model = WhisperModel(
+                    "base",
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 1) // WHISPER_NUM_WORKERS),
+                    num_workers=WHISPER_NUM_WORKERS,
+                )
+                _warm_up_whisper(model)
+                _whisper_model = BatchedInferencePipeline(model=model)
     return _whisper_model
 
 
-def _transcribe_with_whisper(audio_path: Path) -> str:
+def _transcribe_with_whisper(audio: Union[Path, np.ndarray, BinaryIO]) -> str:
     """
     Transcribe recorded audio using local Whisper (no cloud API).
-    Requires ffmpeg to be installed and in PATH.
+    Accepts an audio file path, an in-memory file object (any container
+    PyAV can decode, e.g. browser webm or WAV), or a mono float32 array at
+    16 kHz; arrays are fed to the model directly with no decode step.
     """
-    # Check for ffmpeg first
-    if not _check_ffmpeg_available():
-        print("\n[ERROR] ffmpeg is not installed or not in your PATH.")
-        print("[INFO] Whisper requires ffmpeg to process audio files.")
-        print("[INFO] Please install ffmpeg:")
-        print("  - Windows: Download from https://www.gyan.dev/ffmpeg/builds/")
-        print("            Extract and add the 'bin' folder to your PATH")
-        print("  - Or use: winget install ffmpeg")
-        print("  - Or use: choco install ffmpeg (if you have Chocolatey)")
-        print("  - After installation, restart your terminal/IDE")
-        print("\n[INFO] Fallback: You can type your answer manually when prompted.")
-        return ""
-    
     try:
-        # Ensure we have an absolute path
-        audio_path_abs = audio_path.resolve()
-        
-        # Check if file exists
-        if not audio_path_abs.exists():
-            print(f"[ERROR] Audio file not found: {audio_path_abs}")
-            return ""
-        
-        # Check if file is readable
-        if not os.access(audio_path_abs, os.R_OK):
-            print(f"[ERROR] Audio file is not readable: {audio_path_abs}")
-            return ""
-        
+        if not isinstance(audio, Path):
+            audio_input: Union[str, np.ndarray, BinaryIO] = audio
+        else:
+            # Ensure we have an absolute path, converted to str once for all uses below
+            audio_path_str = str(audio.resolve())
+
+            # Check if file exists
+            if not os.path.exists(audio_path_str):
+                print(f"[ERROR] Audio file not found: {audio_path_str}")
+                return ""
+
+            # Check if file is readable
+            if not os.access(audio_path_str, os.R_OK):
+                print(f"[ERROR] Audio file is not readable: {audio_path_str}")
+                return ""
+
+            audio_input = audio_path_str
+
         model = _get_whisper_model()
-        # Use absolute path as string for Whisper
-        try:
-            result = model.transcribe(str(audio_path_abs))
-        except KeyboardInterrupt:
-            # Gracefully handle user cancelling a long transcription
-            print("\n[INFO] Transcription cancelled by user (Ctrl+C).")
-            return ""
+        # Greedy decoding: beam search costs several times more for little gain on short answers.
+        segments, _ = model.transcribe(
+            audio_input,
+            batch_size=WHISPER_BATCH_SIZE,
+            chunk_length=WHISPER_CHUNK_SECONDS,
+            beam_size=1,
+            vad_filter=True,
+        )
+        # Segments are produced lazily, so decoding happens while joining.
+        text = "".join(segment.text for segment in segments).strip()
 
-        text = (result.get("text") or "").strip()
         print(f"\n[Transcription] {text}\n")
         return text
-    except FileNotFoundError as e:
-        print(f"[ERROR] Local Whisper transcription failed - file not found: {e}")
-        print(f"[INFO] Make sure ffmpeg is installed and in your PATH.")
-        print(f"[INFO] Download ffmpeg from: https://ffmpeg.org/download.html")
-        return ""
     except Exception as e:
-        error_msg = str(e)
-        if "ffmpeg" in error_msg.lower() or "winerror 2" in error_msg.lower():
-            print(f"[ERROR] Local Whisper transcription failed: {e}")
-            print(f"[INFO] Whisper requires ffmpeg to process audio files.")
-            print(f"[INFO] Please install ffmpeg and add it to your PATH.")
-            print(f"[INFO] Windows: Download from https://www.gyan.dev/ffmpeg/builds/")
-            print(f"[INFO] Or use: winget install ffmpeg")
-        else:
-            print(f"[ERROR] Local Whisper transcription failed: {e}")
+        print(f"[ERROR] Local Whisper transcription failed: {e}")
         return ""
 
 
-def _get_openrouter_client() -> OpenAI:
+def _normalize_word(word: str) -> str:
+    return word.strip().strip(".,!?;:\"'").lower()
+
+
+class _StreamingTranscriber:
     """
-    Create an OpenRouter client (OpenAI-compatible) using OPENROUTER_API_KEY.
-    Used for Llama 3.2 3B Instruct chat completions.
+    Transcribe an answer while it is still being recorded.
+    Every `interval_seconds` the uncommitted tail of the audio is re-decoded and
+    words are committed with LocalAgreement-2: a word becomes final once two
+    consecutive passes agree on it. Committed audio is trimmed from the buffer,
+    so when recording stops only the short remaining tail needs decoding.
     """
+
+    def __init__(self, sample_rate: int = 16_000, interval_seconds: float = 1.0) -> None:
+        self._sample_rate = sample_rate
+        self._interval_seconds = interval_seconds
+        self._pending: List[np.ndarray] = []
+        self._pending_lock = threading.Lock()
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._committed: List[str] = []
+        self._previous: List[str] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def feed(self, frame: np.ndarray) -> None:
+        """Queue an int16 frame; safe to call from the audio callback."""
+        with self._pending_lock:
+            self._pending.append(frame)
+
+    def _drain_pending(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            pcm = np.concatenate(pending).astype(np.float32)
+            pcm /= 32768.0
+            self._buffer = np.concatenate((self._buffer, pcm))
+
+    def _decode_buffer(self) -> List[Tuple[float, str]]:
+        """Return (end_seconds, word) pairs for the current buffer."""
+        segments, _ = _get_whisper_model().model.transcribe(
+            self._buffer,
+            beam_size=1,
+            vad_filter=True,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=" ".join(self._committed[-50:]) or None,
+        )
+        return [
+            (word.end, word.word.strip())
+            for segment in segments
+            for word in segment.words or []
+            if word.word.strip()
+        ]
+
+    def _step(self) -> None:
+        self._drain_pending()
+        if len(self._buffer) < self._sample_rate:
+            return
+        hypothesis = self._decode_buffer()
+        agreed = 0
+        for previous_word, (_, word) in zip(self._previous, hypothesis):
+            if _normalize_word(previous_word) != _normalize_word(word):
+                break
+            agreed += 1
+        if agreed:
+            self._committed.extend(word for _, word in hypothesis[:agreed])
+            cut = int(hypothesis[agreed - 1][0] * self._sample_rate)
+            self._buffer = self._buffer[cut:]
+        self._previous = [word for _, word in hypothesis[agreed:]]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            try:
+                self._step()
+            except Exception:
+                # Streaming is best-effort; finish() still decodes whatever is left.
+                return
+
+    def finish(self) -> str:
+        """Stop streaming, decode the uncommitted tail and return the full transcript."""
+        self._stop.set()
+        self._thread.join()
+        try:
+            self._drain_pending()
+            words = list(self._committed)
+            if len(self._buffer):
+                segments, _ = _get_whisper_model().transcribe(
+                    self._buffer,
+                    batch_size=WHISPER_BATCH_SIZE,
+                    chunk_length=WHISPER_CHUNK_SECONDS,
+                    beam_size=1,
+                    vad_filter=True,
+                )
+                tail = "".join(segment.text for segment in segments).strip()
+                if tail:
+                    words.append(tail)
+        except Exception as e:
+            print(f"[ERROR] Local Whisper transcription failed: {e}")
+            return ""
+        text = " ".join(words)
+        if text:
+            print(f"\n[Transcription] {text}\n")
+        return text
+
+
+def _get_openrouter_api_key() -> str:
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         raise RuntimeError(
             "OPENROUTER_API_KEY is not set. Please export it to use OpenRouter."
         )
+    return api_key
+
+
+def _get_openrouter_client() -> OpenAI:
+    """
+    Create an OpenRouter client (OpenAI-compatible) using OPENROUTER_API_KEY.
+    Used for Llama 3.2 3B Instruct chat completions.
+    Requests go over a pooled HTTP/2 connection; the Streamlit app shares one
+    client across all browser sessions, so the pool is sized for concurrency.
+    """
+    api_key = _get_openrouter_api_key()
     try:
+        http_client = httpx.Client(
+            http2=True,
+            timeout=90,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
         # Increase timeout so lengthy LLM generations don't fail abruptly.
         client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key,
             timeout=90,  # seconds
+            http_client=http_client,
+        )
+        return client
+    except Exception as e:
+        raise RuntimeError(f"Failed to initialize OpenRouter client: {e}") from e
+
+
+def _get_async_openrouter_client() -> AsyncOpenAI:
+    """
+    Async counterpart of `_get_openrouter_client` used by the CLI session loop,
+    so LLM round-trips can overlap with local audio work.
+    Requests share one HTTP/2 keep-alive connection, so the interviewer,
+    evaluator and coach calls skip repeated TLS handshakes and can multiplex.
+    Close it with `await client.close()` when the session ends.
+    """
+    api_key = _get_openrouter_api_key()
+    try:
+        http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=90,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+        client = AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+            timeout=90,  # seconds
+            http_client=http_client,
         )
         return client
     except Exception as e:
@@ -479,39 +950,91 @@ def _build_coach_prompt(
     return system_prompt
 
 
-def _ask_interviewer_question(
-    client: OpenAI,
+@functools.lru_cache(maxsize=4)
+def _build_system_prompts(agents_mtime_ns: int, tasks_mtime_ns: int) -> Tuple[str, str]:
+    agents_cfg = _load_yaml(CONFIG_DIR / "agents.yaml")
+    tasks_cfg = _load_yaml(CONFIG_DIR / "tasks.yaml")
+    return (
+        _build_dynamic_interview_prompt(agents_cfg, tasks_cfg),
+        _build_coach_prompt(agents_cfg, tasks_cfg),
+    )
+
+
+def _system_prompts() -> Tuple[str, str]:
+    """
+    Return (dynamic_interview_prompt, coach_prompt). Both depend only on the
+    YAML configs, so they are rebuilt only when agents.yaml or tasks.yaml changes.
+    """
+    return _build_system_prompts(
+        (CONFIG_DIR / "agents.yaml").stat().st_mtime_ns,
+        (CONFIG_DIR / "tasks.yaml").stat().st_mtime_ns,
+    )
+
+
+# OpenRouter model families whose providers honour `cache_control` breakpoints.
+_PROMPT_CACHE_BREAKPOINT_PREFIXES = ("anthropic/", "google/")
+
+
+def _system_message(system_prompt: str, model: str) -> Dict[str, Any]:
+    """
+    System message for `model`. The prompt is identical on every turn, so for
+    model families that support OpenRouter cache_control breakpoints it is
+    marked as one and only prefilled once. Other providers get plain string
+    content, since the marker would do nothing there.
+    """
+    if not model.startswith(_PROMPT_CACHE_BREAKPOINT_PREFIXES):
+        return {"role": "system", "content": system_prompt}
+    return {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+
+
+# Sampling and output settings shared by every interviewer / coach / evaluator request.
+_INTERVIEWER_REQUEST_KWARGS: Dict[str, Any] = {
+    "temperature": 0.6,
+    "top_p": 0.9,
+    "max_tokens": 600,
+    "response_format": {"type": "json_object"},
+}
+_COACH_REQUEST_KWARGS: Dict[str, Any] = {
+    "temperature": 0.4,
+    "top_p": 0.9,
+    "max_tokens": 900,
+    "response_format": {"type": "json_object"},
+}
+_TECHNICAL_EVAL_REQUEST_KWARGS: Dict[str, Any] = {
+    "temperature": 0.3,
+    "top_p": 0.9,
+    "max_tokens": 500,
+    "response_format": {"type": "json_object"},
+}
+
+
+def _interviewer_messages(
     system_prompt: str,
     model: str,
     candidate_profile: Dict[str, Any],
     conversation_state: Dict[str, Any],
     latest_answer: str,
-) -> Dict[str, Any]:
-    """
-    Call a LLaMA 3.x ~7–8B Instruct model via OpenRouter to get the next
-    interviewer question in structured JSON.
-    """
+) -> List[Dict[str, Any]]:
     user_payload = {
         "candidate_profile": candidate_profile,
         "conversation_state": conversation_state,
         "latest_answer": latest_answer,
     }
+    return [
+        _system_message(system_prompt, model),
+        {"role": "user", "content": orjson.dumps(user_payload).decode("utf-8")},
+    ]
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(user_payload)},
-        ],
-        temperature=0.6,
-        top_p=0.9,
-        max_tokens=600,
-        response_format={"type": "json_object"},
-    )
-    content = response.choices[0].message.content
+
+def _parse_interviewer_response(content: str) -> Dict[str, Any]:
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
         return {
             "persona": None,
             "next_round": "unknown",
@@ -524,6 +1047,166 @@ def _ask_interviewer_question(
         }
 
 
+def _ask_interviewer_question(
+    client: OpenAI,
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    conversation_state: Dict[str, Any],
+    latest_answer: str,
+) -> Dict[str, Any]:
+    """
+    Call a LLaMA 3.x ~7–8B Instruct model via OpenRouter to get the next
+    interviewer question in structured JSON.
+    """
+    response = client.chat.completions.create(
+        model=model,
+        messages=_interviewer_messages(
+            system_prompt, model, candidate_profile, conversation_state, latest_answer
+        ),
+        **_INTERVIEWER_REQUEST_KWARGS,
+    )
+    return _parse_interviewer_response(response.choices[0].message.content)
+
+
+# Captures next_question.text as it streams in (the closing quote may not have arrived yet).
+_PARTIAL_QUESTION_TEXT_RE = re.compile(
+    r'"next_question"\s*:\s*\{[^{}]*?"text"\s*:\s*"((?:[^"\\]|\\.)*)',
+    re.DOTALL,
+)
+# A trailing escape sequence that has not been fully streamed yet.
+_TRAILING_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{0,3})?$")
+
+
+class _JsonStreamCollector:
+    """
+    Accumulate a streamed JSON completion chunk by chunk; feed it the chunks of
+    a sync or an async stream. `on_partial` receives the decoded value of the
+    string field captured by `field_re` each time it grows, and `on_complete`
+    receives it once, as soon as its closing quote has been streamed.
+    """
+
+    def __init__(
+        self,
+        field_re: "re.Pattern[str]",
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_complete: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.content = ""
+        self._field_re = field_re
+        self._on_partial = on_partial
+        self._on_complete = on_complete
+        self._value = ""
+        self._complete = False
+
+    def feed(self, chunk: Any) -> None:
+        if not chunk.choices:
+            return
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            return
+        self.content += delta
+        if self._complete:
+            return
+        match = self._field_re.search(self.content)
+        if not match:
+            return
+        try:
+            # Drop a trailing, not yet complete escape sequence before decoding.
+            value = json.loads('"' + _TRAILING_ESCAPE_RE.sub("", match.group(1)) + '"')
+        except json.JSONDecodeError:
+            return
+        if value != self._value:
+            self._value = value
+            if self._on_partial is not None:
+                self._on_partial(value)
+        if self.content.startswith('"', match.end()):
+            self._complete = True
+            if self._on_complete is not None:
+                self._on_complete(value)
+
+
+def _ask_interviewer_question_stream(
+    client: OpenAI,
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    conversation_state: Dict[str, Any],
+    latest_answer: str,
+    on_partial_question: Callable[[str], None],
+) -> Dict[str, Any]:
+    """
+    Streaming variant of `_ask_interviewer_question`.
+    `on_partial_question` receives the question text decoded so far each time
+    it grows, long before the rest of the JSON has been generated.
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=_interviewer_messages(
+            system_prompt, model, candidate_profile, conversation_state, latest_answer
+        ),
+        **_INTERVIEWER_REQUEST_KWARGS,
+        stream=True,
+    )
+    collector = _JsonStreamCollector(_PARTIAL_QUESTION_TEXT_RE, on_partial=on_partial_question)
+    for chunk in stream:
+        collector.feed(chunk)
+    return _parse_interviewer_response(collector.content)
+
+
+async def _aask_interviewer_question(
+    client: AsyncOpenAI,
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    conversation_state: Dict[str, Any],
+    latest_answer: str,
+    on_question_text: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Async variant of `_ask_interviewer_question` for the CLI event loop.
+    The completion is streamed; `on_question_text` is called as soon as the
+    question text is complete, before the rest of the JSON has arrived.
+    """
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=_interviewer_messages(
+            system_prompt, model, candidate_profile, conversation_state, latest_answer
+        ),
+        **_INTERVIEWER_REQUEST_KWARGS,
+        stream=True,
+    )
+    collector = _JsonStreamCollector(_PARTIAL_QUESTION_TEXT_RE, on_complete=on_question_text)
+    async for chunk in stream:
+        collector.feed(chunk)
+    return _parse_interviewer_response(collector.content)
+
+
+def _coach_messages(
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    qa_list: List[Dict[str, Any]],
+    feedback_mode: str,
+) -> List[Dict[str, Any]]:
+    user_payload = {
+        "candidate_profile": candidate_profile,
+        "qa_list": qa_list,
+        "feedback_mode": feedback_mode,
+    }
+    return [
+        _system_message(system_prompt, model),
+        {"role": "user", "content": orjson.dumps(user_payload).decode("utf-8")},
+    ]
+
+
+def _parse_coach_response(content: str) -> Dict[str, Any]:
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return {"raw_feedback": content}
+
+
 def _analyze_with_coach(
     client: OpenAI,
     system_prompt: str,
@@ -536,44 +1219,117 @@ def _analyze_with_coach(
     Call LLaMA 3.3 70B Instruct via OpenRouter with the coach prompt to
     analyze the full interview.
     """
+    response = client.chat.completions.create(
+        model=model,
+        messages=_coach_messages(system_prompt, model, candidate_profile, qa_list, feedback_mode),
+        **_COACH_REQUEST_KWARGS,
+    )
+    return _parse_coach_response(response.choices[0].message.content)
+
+
+# Captures overall_summary as it streams in (the closing quote may not have arrived yet).
+_PARTIAL_SUMMARY_RE = re.compile(r'"overall_summary"\s*:\s*"((?:[^"\\]|\\.)*)', re.DOTALL)
+
+
+def _analyze_with_coach_stream(
+    client: OpenAI,
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    qa_list: List[Dict[str, Any]],
+    feedback_mode: str,
+    on_partial_summary: Callable[[str], None],
+) -> Dict[str, Any]:
+    """
+    Streaming variant of `_analyze_with_coach`.
+    `on_partial_summary` receives overall_summary as it is generated, so the
+    summary can be shown while the rest of the feedback JSON is still coming.
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=_coach_messages(system_prompt, model, candidate_profile, qa_list, feedback_mode),
+        **_COACH_REQUEST_KWARGS,
+        stream=True,
+    )
+    collector = _JsonStreamCollector(_PARTIAL_SUMMARY_RE, on_partial=on_partial_summary)
+    for chunk in stream:
+        collector.feed(chunk)
+    return _parse_coach_response(collector.content)
+
+
+async def _aanalyze_with_coach(
+    client: AsyncOpenAI,
+    system_prompt: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    qa_list: List[Dict[str, Any]],
+    feedback_mode: str,
+) -> Dict[str, Any]:
+    """Async variant of `_analyze_with_coach` for the CLI event loop."""
+    response = await client.chat.completions.create(
+        model=model,
+        messages=_coach_messages(system_prompt, model, candidate_profile, qa_list, feedback_mode),
+        **_COACH_REQUEST_KWARGS,
+    )
+    return _parse_coach_response(response.choices[0].message.content)
+
+
+def _batch_analyze_with_coach(
+    client: OpenAI,
+    system_prompt: str,
+    model: str,
+    sessions: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Analyze several saved sessions in one coach call, so the system prompt and
+    preamble are paid once instead of once per session.
+    Returns {"per_session": [feedback, ...]} in the same order as `sessions`.
+    """
+    batch_system_prompt = (
+        f"{system_prompt}\n\n"
+        "BATCH MODE:\n"
+        "- The input contains a 'sessions' array; each item has its own candidate_profile, qa_list and feedback_mode.\n"
+        "- Evaluate every session independently, following all rules above for each one.\n"
+        "- Respond with a single JSON object of the form {\"per_session\": [...]}, containing exactly one "
+        "feedback object per input session, in the same order."
+    )
     user_payload = {
-        "candidate_profile": candidate_profile,
-        "qa_list": qa_list,
-        "feedback_mode": feedback_mode,
+        "sessions": [
+            {
+                "candidate_profile": session.get("candidate_profile", {}),
+                "qa_list": session.get("qa_list", []),
+                "feedback_mode": session.get("feedback_mode", "coaching"),
+            }
+            for session in sessions
+        ]
     }
 
     response = client.chat.completions.create(
         model=model,
         messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(user_payload)},
+            {"role": "system", "content": batch_system_prompt},
+            {"role": "user", "content": orjson.dumps(user_payload).decode("utf-8")},
         ],
         temperature=0.4,
         top_p=0.9,
-        max_tokens=900,
+        max_tokens=min(900 * len(sessions), 4000),
         response_format={"type": "json_object"},
     )
     content = response.choices[0].message.content
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        return {"raw_feedback": content}
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return {"per_session": [], "raw_feedback": content}
 
 
-def _evaluate_technical_answer(
-    client: OpenAI,
+def _technical_eval_messages(
     system_prompt_role: str,
-    model: str,
     candidate_profile: Dict[str, Any],
     question_text: str,
     answer_text: str,
     question_type: str,
     skill_tags: List[str],
-) -> Dict[str, Any]:
-    """
-    Use the LLM to quickly evaluate a single technical answer (coding / SQL, etc.).
-    Returns a small JSON object with a verdict, brief feedback, and an ideal outline.
-    """
+) -> List[Dict[str, Any]]:
     system_prompt = (
         "You are a senior technical interviewer evaluating ONE answer from a candidate.\n"
         f"Context role: {system_prompt_role}.\n\n"
@@ -595,32 +1351,86 @@ def _evaluate_technical_answer(
         "question_type": question_type,
         "skill_tags": skill_tags,
     }
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": orjson.dumps(user_payload).decode("utf-8")},
+    ]
+
+
+def _technical_eval_error(e: Exception) -> Dict[str, Any]:
+    return {
+        "is_correct": False,
+        "score_0_to_1": 0.0,
+        "short_verdict": "Could not run automated evaluation.",
+        "detailed_feedback": f"Internal error while evaluating answer: {e}",
+        "ideal_answer_outline": "",
+    }
+
 
+def _evaluate_technical_answer(
+    client: OpenAI,
+    system_prompt_role: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    question_text: str,
+    answer_text: str,
+    question_type: str,
+    skill_tags: List[str],
+) -> Dict[str, Any]:
+    """
+    Use the LLM to quickly evaluate a single technical answer (coding / SQL, etc.).
+    Returns a small JSON object with a verdict, brief feedback, and an ideal outline.
+    """
     try:
         response = client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": json.dumps(user_payload)},
-            ],
-            temperature=0.3,
-            top_p=0.9,
-            max_tokens=500,
-            response_format={"type": "json_object"},
+            messages=_technical_eval_messages(
+                system_prompt_role,
+                candidate_profile,
+                question_text,
+                answer_text,
+                question_type,
+                skill_tags,
+            ),
+            **_TECHNICAL_EVAL_REQUEST_KWARGS,
         )
         content = response.choices[0].message.content
-        return json.loads(content)
+        return orjson.loads(content)
     except Exception as e:
-        return {
-            "is_correct": False,
-            "score_0_to_1": 0.0,
-            "short_verdict": "Could not run automated evaluation.",
-            "detailed_feedback": f"Internal error while evaluating answer: {e}",
-            "ideal_answer_outline": "",
-        }
+        return _technical_eval_error(e)
+
+
+async def _aevaluate_technical_answer(
+    client: AsyncOpenAI,
+    system_prompt_role: str,
+    model: str,
+    candidate_profile: Dict[str, Any],
+    question_text: str,
+    answer_text: str,
+    question_type: str,
+    skill_tags: List[str],
+) -> Dict[str, Any]:
+    """Async variant of `_evaluate_technical_answer` for the CLI event loop."""
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=_technical_eval_messages(
+                system_prompt_role,
+                candidate_profile,
+                question_text,
+                answer_text,
+                question_type,
+                skill_tags,
+            ),
+            **_TECHNICAL_EVAL_REQUEST_KWARGS,
+        )
+        content = response.choices[0].message.content
+        return orjson.loads(content)
+    except Exception as e:
+        return _technical_eval_error(e)
 
 
-def _start_voice_interview_session() -> None:
+async def _start_voice_interview_session() -> None:
     """
     Run an interactive, voice-based interview session:
     - Interviewer asks questions via Google TTS (and prints text)
@@ -630,6 +1440,11 @@ def _start_voice_interview_session() -> None:
     """
     _ensure_sessions_dir()
 
+    # Load Whisper in the background while the user types their profile.
+    whisper_pool = ThreadPoolExecutor(max_workers=1)
+    whisper_pool.submit(_get_whisper_model)
+    whisper_pool.shutdown(wait=False)
+
     print("=== Voice Interview Practice System ===\n")
     user_name = input("Your name: ").strip() or "anonymous"
     target_role = input("Target role (e.g., SDE, Data Analyst, PM): ").strip()
@@ -645,7 +1460,7 @@ def _start_voice_interview_session() -> None:
     }
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in user_name)
+    safe_name = _safe_session_name(user_name)
     session_filename = f"{safe_name or 'candidate'}_{timestamp}.json"
     session_path = SESSIONS_DIR / session_filename
 
@@ -657,145 +1472,207 @@ def _start_voice_interview_session() -> None:
         "created_at_utc": timestamp,
     }
 
-    agents_cfg = _load_yaml(CONFIG_DIR / "agents.yaml")
-    tasks_cfg = _load_yaml(CONFIG_DIR / "tasks.yaml")
-
-    dynamic_system_prompt = _build_dynamic_interview_prompt(agents_cfg, tasks_cfg)
-    coach_system_prompt = _build_coach_prompt(agents_cfg, tasks_cfg)
+    dynamic_system_prompt, coach_system_prompt = _system_prompts()
 
     # OpenRouter client runs a larger Llama 3.x (~7–8B) model for interviewer + coach
-    openrouter_client = _get_openrouter_client()
+    openrouter_client = _get_async_openrouter_client()
     chat_model = "meta-llama/llama-3.1-8b-instruct"
 
     conversation_state: Dict[str, Any] = {"qa_list": []}
     latest_answer_text = ""
     interviewer_persona: Optional[str] = None
+    coach_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+    next_question_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
 
-    print(f"\nSession JSON will be saved to: {session_path}\n")
-    turn_index = 0
-    while True:
-        turn_index += 1
-        print(f"\n--- Interview Turn {turn_index} ---")
-
-        question_struct = _ask_interviewer_question(
-            client=openrouter_client,
-            system_prompt=dynamic_system_prompt,
-            model=chat_model,
-            candidate_profile=candidate_profile,
-            conversation_state=conversation_state,
-            latest_answer=latest_answer_text,
-        )
-
-        persona = question_struct.get("persona")
-        if persona and not interviewer_persona:
-            interviewer_persona = persona
-            session_data["interviewer_persona"] = persona
-            print(f"\n[Interviewer Persona] {persona}\n")
-
-            # Let the interviewer introduce itself using its persona, via voice.
-            intro_voice = (
-                f"Hello {user_name or 'there'}. "
-                f"My name is {persona}. "
-                f"I will be your interviewer for the {target_role or 'selected'} role. "
-                "I will ask you questions and listen to your answers. "
-                "Let us begin."
-            )
-            _speak_text_google_tts(intro_voice)
-
-        next_round = question_struct.get("next_round", "unknown")
-        next_question_obj = question_struct.get("next_question", {}) or {}
-        question_text = next_question_obj.get("text", "Please answer this question.")
-        end_interview = bool(question_struct.get("end_interview", False))
+    # Question audio is synthesized while the rest of the interviewer JSON streams in.
+    question_audio: Dict[str, "asyncio.Task[bytes]"] = {}
 
-        print(f"[Round] {next_round}")
-        print(f"[Question] {question_text}\n")
+    def _prefetch_question_audio(text: str) -> None:
+        question_audio[text] = asyncio.create_task(_asynthesize_tts(text))
 
-        _speak_text_google_tts(question_text)
-
-        # Record answer to a temporary audio file (not persisted in sessions)
-        tmp_dir = Path(tempfile.gettempdir())
-        audio_filename = tmp_dir / f"voice_interview_{safe_name or 'candidate'}_{timestamp}_turn{turn_index}.wav"
-        recorded = _record_audio_to_file(audio_filename)
-
-        try:
-            if recorded:
-                answer_text = _transcribe_with_whisper(audio_filename)
+    # Write the metadata right away so even an aborted session leaves its JSON file.
+    _write_session_json(session_path, session_data)
+    print(f"\nSession JSON will be saved to: {session_path}\n")
+    try:
+        turn_index = 0
+        while True:
+            turn_index += 1
+            print(f"\n--- Interview Turn {turn_index} ---")
+
+            if next_question_task is None:
+                next_question_task = asyncio.create_task(
+                    _aask_interviewer_question(
+                        client=openrouter_client,
+                        system_prompt=dynamic_system_prompt,
+                        model=chat_model,
+                        candidate_profile=candidate_profile,
+                        conversation_state=conversation_state,
+                        latest_answer=latest_answer_text,
+                        on_question_text=_prefetch_question_audio,
+                    )
+                )
+            question_struct = await next_question_task
+            next_question_task = None
+
+            persona = question_struct.get("persona")
+            if persona and not interviewer_persona:
+                interviewer_persona = persona
+                session_data["interviewer_persona"] = persona
+                print(f"\n[Interviewer Persona] {persona}\n")
+
+                # Let the interviewer introduce itself using its persona, via voice.
+                intro_voice = (
+                    f"Hello {user_name or 'there'}. "
+                    f"My name is {persona}. "
+                    f"I will be your interviewer for the {target_role or 'selected'} role. "
+                    "I will ask you questions and listen to your answers. "
+                    "Let us begin."
+                )
+                await _aspeak_text_google_tts(intro_voice, cache=True)
+
+            next_round = question_struct.get("next_round", "unknown")
+            next_question_obj = question_struct.get("next_question", {}) or {}
+            question_text = next_question_obj.get("text", "Please answer this question.")
+            end_interview = bool(question_struct.get("end_interview", False))
+
+            print(f"[Round] {next_round}")
+            print(f"[Question] {question_text}\n")
+
+            await _aspeak_text_google_tts(
+                question_text, synthesis=question_audio.pop(question_text, None)
+            )
+            for stale in question_audio.values():
+                stale.cancel()
+            question_audio.clear()
+
+            # Record the answer in memory only (audio is never persisted),
+            # transcribing it while the candidate is still speaking.
+            await _await_record_start()
+            transcriber = _StreamingTranscriber()
+            transcriber.start()
+            stop_recording = threading.Event()
+            with _sigint_sets(stop_recording):
+                audio = await asyncio.to_thread(
+                    _record_answer_audio, on_frame=transcriber.feed, stop=stop_recording
+                )
+            streamed_text = await asyncio.to_thread(transcriber.finish)
+
+            if audio is not None:
+                answer_text = streamed_text
+                if not answer_text:
+                    # Streaming failed or heard nothing; retry once on the full recording.
+                    answer_text = await asyncio.to_thread(_transcribe_with_whisper, audio)
                 # If Whisper did not return anything (or was cancelled), fall back to manual input
                 if not answer_text.strip():
                     print("[INFO] No transcription captured. You can type your answer instead.")
                     answer_text = input("Please type your answer (fallback): ").strip()
             else:
                 answer_text = input("Please type your answer (fallback): ").strip()
-        finally:
-            # Best-effort cleanup: do not keep answer recordings on disk
-            try:
-                if audio_filename.exists():
-                    audio_filename.unlink()
-            except Exception:
-                pass
-
-        latest_answer_text = answer_text
 
-        # Only store text in the session JSON (no audio file paths)
-        qa_entry: Dict[str, Any] = {
-            "turn": turn_index,
-            "round": next_round,
-            "question": question_text,
-            "answer_text": answer_text,
-        }
-
-        # For technical questions (DSA, SQL, etc.), run an automatic correctness check.
-        skill_tags = next_question_obj.get("skill_tags", []) or []
-        question_type = str(next_question_obj.get("question_type", "") or "").lower()
-        technical_tags = {tag.lower() for tag in skill_tags}
-        is_technical = any(
-            tag in technical_tags for tag in ["dsa", "coding", "algorithm", "sql", "sql_query", "query"]
-        ) or question_type in {"technical", "coding", "dsa", "sql"}
-
-        if is_technical and answer_text.strip():
-            tech_role_hint = f"{candidate_profile.get('target_role','')} @ {candidate_profile.get('company_type','')}"
-            tech_eval = _evaluate_technical_answer(
+            latest_answer_text = answer_text
+
+            # Only store text in the session JSON (no audio file paths)
+            qa_entry: Dict[str, Any] = {
+                "turn": turn_index,
+                "round": next_round,
+                "question": question_text,
+                "answer_text": answer_text,
+            }
+
+            # For technical questions (DSA, SQL, etc.), run an automatic correctness check.
+            skill_tags = next_question_obj.get("skill_tags", []) or []
+            question_type = str(next_question_obj.get("question_type", "") or "").lower()
+            technical_tags = {tag.lower() for tag in skill_tags}
+            is_technical = any(
+                tag in technical_tags for tag in ["dsa", "coding", "algorithm", "sql", "sql_query", "query"]
+            ) or question_type in {"technical", "coding", "dsa", "sql"}
+
+            if is_technical and answer_text.strip():
+                tech_role_hint = f"{candidate_profile.get('target_role','')} @ {candidate_profile.get('company_type','')}"
+                tech_eval = await _aevaluate_technical_answer(
+                    client=openrouter_client,
+                    system_prompt_role=tech_role_hint,
+                    model=chat_model,
+                    candidate_profile=candidate_profile,
+                    question_text=question_text,
+                    answer_text=answer_text,
+                    question_type=question_type,
+                    skill_tags=skill_tags,
+                )
+                qa_entry["technical_evaluation"] = tech_eval
+            session_data["qa_list"].append(qa_entry)
+            conversation_state["qa_list"] = session_data["qa_list"]
+
+            if not end_interview:
+                # Everything the interviewer needs is final now, so its next request
+                # overlaps with the disk write and the continue prompt below.
+                next_question_task = asyncio.create_task(
+                    _aask_interviewer_question(
+                        client=openrouter_client,
+                        system_prompt=dynamic_system_prompt,
+                        model=chat_model,
+                        candidate_profile=candidate_profile,
+                        conversation_state=conversation_state,
+                        latest_answer=latest_answer_text,
+                        on_question_text=_prefetch_question_audio,
+                    )
+                )
+            await asyncio.to_thread(_append_session_turn, session_path, qa_entry)
+
+            if end_interview:
+                print("\n[System] Interview has concluded according to the interviewer agent.\n")
+                break
+
+            if turn_index >= SPECULATIVE_COACH_MIN_TURNS:
+                # qa_list is final for this turn, so if the user quits below the
+                # coach result is valid as-is; otherwise it is simply cancelled.
+                coach_task = asyncio.create_task(
+                    _aanalyze_with_coach(
+                        client=openrouter_client,
+                        system_prompt=coach_system_prompt,
+                        model=chat_model,
+                        candidate_profile=candidate_profile,
+                        qa_list=list(session_data["qa_list"]),
+                        feedback_mode=feedback_mode,
+                    )
+                )
+
+            user_continue = (
+                await _ainput("Press Enter to continue to the next question (or type 'q' to quit): ")
+            ).strip().lower()
+            if user_continue == "q":
+                print("Ending interview early by user request.\n")
+                if next_question_task is not None:
+                    next_question_task.cancel()
+                for stale in question_audio.values():
+                    stale.cancel()
+                break
+
+            if coach_task is not None:
+                coach_task.cancel()
+                coach_task = None
+
+        print("\n=== Analyzing your performance with the coach agent ===\n")
+        if coach_task is not None:
+            coach_feedback = await coach_task
+        else:
+            coach_feedback = await _aanalyze_with_coach(
                 client=openrouter_client,
-                system_prompt_role=tech_role_hint,
+                system_prompt=coach_system_prompt,
                 model=chat_model,
                 candidate_profile=candidate_profile,
-                question_text=question_text,
-                answer_text=answer_text,
-                question_type=question_type,
-                skill_tags=skill_tags,
+                qa_list=session_data["qa_list"],
+                feedback_mode=feedback_mode,
             )
-            qa_entry["technical_evaluation"] = tech_eval
-        session_data["qa_list"].append(qa_entry)
-        conversation_state["qa_list"] = session_data["qa_list"]
-
-        with session_path.open("w", encoding="utf-8") as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
-
-        if end_interview:
-            print("\n[System] Interview has concluded according to the interviewer agent.\n")
-            break
-
-        user_continue = input("Press Enter to continue to the next question (or type 'q' to quit): ").strip().lower()
-        if user_continue == "q":
-            print("Ending interview early by user request.\n")
-            break
-
-    print("\n=== Analyzing your performance with the coach agent ===\n")
-    coach_feedback = _analyze_with_coach(
-        client=openrouter_client,
-        system_prompt=coach_system_prompt,
-        model=chat_model,
-        candidate_profile=candidate_profile,
-        qa_list=session_data["qa_list"],
-        feedback_mode=feedback_mode,
-    )
 
-    session_data["coach_feedback"] = coach_feedback
-    with session_path.open("w", encoding="utf-8") as f:
-        json.dump(session_data, f, ensure_ascii=False, indent=2)
+        session_data["coach_feedback"] = coach_feedback
 
-    print("Coach feedback (JSON):")
-    print(json.dumps(coach_feedback, ensure_ascii=False, indent=2))
+        print("Coach feedback (JSON):")
+        print(orjson.dumps(coach_feedback, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    finally:
+        # Also runs on Ctrl+C or a failed coach call, so every answered turn is kept.
+        _write_session_json(session_path, session_data)
+        await openrouter_client.close()
 
 
 def run() -> None:
@@ -803,7 +1680,42 @@ def run() -> None:
     Entry point used by `crewai run`:
     Launch an interactive voice-based interview session.
     """
-    _start_voice_interview_session()
+    asyncio.run(_start_voice_interview_session())
+
+
+def summarize_recent() -> None:
+    """
+    Coach the most recent saved sessions together in a single LLM call.
+    Usage: summarize_recent [N]  (defaults to the last 3 sessions)
+    """
+    count_arg = sys.argv[-1] if len(sys.argv) > 1 else ""
+    limit = int(count_arg) if count_arg.isdigit() else 3
+
+    sessions = _load_recent_sessions(limit)
+    if not sessions:
+        print(f"No saved sessions with answers found in {SESSIONS_DIR}.")
+        return
+
+    print(f"=== Analyzing your last {len(sessions)} session(s) with the coach agent ===\n")
+    batch_feedback = _batch_analyze_with_coach(
+        client=_get_openrouter_client(),
+        system_prompt=_system_prompts()[1],
+        model="meta-llama/llama-3.1-8b-instruct",
+        sessions=sessions,
+    )
+
+    per_session = batch_feedback.get("per_session") or []
+    if not per_session:
+        print(orjson.dumps(batch_feedback, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+    for session_data, feedback in zip(sessions, per_session):
+        profile = session_data.get("candidate_profile", {})
+        print(
+            f"--- {profile.get('user_name') or 'candidate'} "
+            f"({session_data.get('created_at_utc', 'unknown time')}) ---"
+        )
+        print(orjson.dumps(feedback, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        print()
 
 
 def train() -> None:
@@ -870,6 +1782,8 @@ if __name__ == "__main__":
         replay()
     elif command == "test":
         test()
+    elif command == "summarize_recent":
+        summarize_recent()
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
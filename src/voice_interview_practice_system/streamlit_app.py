@@ -1,70 +1,232 @@
 import base64
-import json
+import hashlib
+import os
 import re
-import tempfile
+import shutil
+import subprocess
+import threading
 import time
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
+import orjson
+import pandas as pd
 import streamlit as st
 from gtts import gTTS
 from streamlit_mic_recorder import mic_recorder
 
 from voice_interview_practice_system.main import (  # type: ignore[import-not-found]
-    CONFIG_DIR,
     SESSIONS_DIR,
-    _analyze_with_coach,
-    _ask_interviewer_question,
-    _build_coach_prompt,
-    _build_dynamic_interview_prompt,
+    _analyze_with_coach_stream,
+    _ask_interviewer_question_stream,
     _ensure_sessions_dir,
     _get_openrouter_client,
-    _load_yaml,
     _transcribe_with_whisper,
     _evaluate_technical_answer,
+    _get_whisper_model,
+    _append_session_turn,
+    _safe_session_name,
+    _system_prompts,
+    _write_session_json,
 )
 
 
 # Simple bot avatar used when the interviewer is speaking
 BOT_AVATAR_URL = "https://cdn-icons-png.flaticon.com/512/4712/4712105.png"
 
+# Global styling to give the app a more eye-catching, modern look.
+_GLOBAL_CSS = """
+<style>
+/* Overall app background */
+.stApp {
+    background: radial-gradient(circle at top left, #020617 0, #020617 35%, #020617 40%, #020617 60%, #020617 100%);
+    background-color: #020617;
+}
+
+/* Sidebar */
+[data-testid="stSidebar"] {
+    background: linear-gradient(180deg, #020617 0%, #111827 50%, #020617 100%);
+    border-right: 1px solid rgba(148, 163, 184, 0.25);
+}
+
+/* Headings */
+h2, h3, h4 {
+    color: #e5e7eb !important;
+}
+
+/* Cards / containers */
+.ctrlhire-card {
+    background: radial-gradient(circle at top left, #4f46e5 0%, #0f172a 55%, #020617 100%);
+    border-radius: 1.25rem;
+    padding: 2rem 1.75rem;
+    box-shadow: 0 24px 60px rgba(15, 23, 42, 0.85);
+    border: 1px solid rgba(129, 140, 248, 0.45);
+}
+
+.ctrlhire-hero-title {
+    font-size: 2.1rem;
+    font-weight: 700;
+    letter-spacing: 0.03em;
+    color: #f9fafb;
+    margin-bottom: 0.25rem;
+}
+
+.ctrlhire-hero-subtitle {
+    color: #cbd5f5;
+    font-size: 0.98rem;
+    max-width: 46rem;
+}
+</style>
+"""
+
+_HERO_HTML = """
+<div class="ctrlhire-card" style="margin-bottom: 1.75rem;">
+  <div class="ctrlhire-hero-title">Ctrl+Hire</div>
+  <p class="ctrlhire-hero-subtitle" style="margin-bottom: 0.85rem;">
+    A modern, voice‑first studio to rehearse tough interviews with an AI that actually feels like the hiring panel.
+  </p>
+  <p class="ctrlhire-hero-subtitle" style="opacity: 0.9;">
+    JD‑aware questions, built‑in code pads for DSA / SQL, and a performance coach that explains
+    <strong>what you did well</strong> and <strong>what to sharpen next</strong> — all in one place.
+  </p>
+</div>
+"""
+
+_AUDIO_HTML_TEMPLATE = """
+<audio autoplay style="display:none;">
+    <source src="data:{mime};base64,{b64}" type="{mime}">
+    Your browser does not support the audio element.
+</audio>
+"""
+
+# Optional offline TTS: point PIPER_MODEL at a piper voice (.onnx) and put the
+# `piper` binary on PATH to synthesize locally instead of calling Google (gTTS).
+PIPER_MODEL = os.getenv("PIPER_MODEL", "")
+USE_PIPER_TTS = bool(PIPER_MODEL) and shutil.which("piper") is not None
+
+# How often a page waiting on a background job reruns to check on it.
+JOB_POLL_SECONDS = 0.25
+
+# End of a sentence in streamed question text (punctuation followed by whitespace).
+_SENTENCE_END_RE = re.compile(r"[.!?]\s")
+
 
 def _extract_first_code_block(text: str) -> str:
-    """Return the first fenced code block (preferably python) from the text, if any."""
+    r"""
+    Return the first fenced code block (preferably python) from the text, if any.
+
+    >>> _extract_first_code_block("```python\ndef f():\n    pass\n```")
+    'def f():\n    pass'
+    >>> _extract_first_code_block("Use ```x = 1``` then\n```sql\nSELECT 2\n```")
+    'x = 1'
+    >>> _extract_first_code_block("```python x=1```")
+    'x=1'
+    >>> _extract_first_code_block("```sql\nSELECT 1\n```")
+    'sql\nSELECT 1'
+    """
     if not text:
         return ""
-    pattern = r"```(?:python)?\s*(.*?)```"
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-    if not match:
+    # Plain str.find scans for the literal fences; no regex backtracking on every rerun.
+    open_fence = text.find("```")
+    if open_fence < 0:
         return ""
-    return match.group(1).strip("\n")
+    body_start = open_fence + 3
+    close_fence = text.find("```", body_start)
+    if close_fence < 0:
+        return ""
+    line_end = text.find("\n", body_start, close_fence)
+    if line_end >= 0:
+        # Skip the info string when it is empty or "python"; other languages keep it.
+        if text[body_start:line_end].strip().lower() in ("", "python"):
+            body_start = line_end + 1
+        return text[body_start:close_fence].strip("\n")
+    # Single-line fence such as ```python x = 1```: drop only a leading python token.
+    if text[body_start : body_start + 6].lower() == "python":
+        body_start += 6
+    return text[body_start:close_fence].strip()
+
+
+def _piper_wav_bytes(text: str) -> bytes:
+    """Synthesize WAV bytes locally with the piper CLI and the PIPER_MODEL voice."""
+    # piper writes one WAV per input line, so feed it the text as a single line.
+    result = subprocess.run(
+        ["piper", "--model", PIPER_MODEL, "--output_file", "-"],
+        input=" ".join(text.split()).encode("utf-8"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return result.stdout
 
 
-def _tts_bytes(text: str) -> bytes:
-    """Generate MP3 audio bytes from text using gTTS (for Streamlit playback)."""
+def _tts_bytes_uncached(text: str, lang: str = "en", slow: bool = False) -> bytes:
+    """
+    Generate audio bytes from text for Streamlit playback: WAV from local
+    piper when it is configured, otherwise (or if piper fails) MP3 from gTTS.
+    """
     if not text:
         return b""
+    if USE_PIPER_TTS:
+        try:
+            return _piper_wav_bytes(text)
+        except (OSError, subprocess.CalledProcessError):
+            # A broken piper setup should not cost the question its voice.
+            pass
     buf = BytesIO()
-    tts = gTTS(text=text, lang="en", slow=False)
+    tts = gTTS(text=text, lang=lang, slow=slow)
     tts.write_to_fp(buf)
-    buf.seek(0)
-    return buf.read()
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=256, ttl=3600)
+def _tts_bytes(text: str, lang: str = "en", slow: bool = False) -> bytes:
+    """
+    Cached TTS synthesis keyed by (text, lang, slow).
+    Streamlit reruns the script on every widget interaction; TTS output is
+    deterministic, so repeat renders reuse the audio instead of synthesizing again.
+    """
+    return _tts_bytes_uncached(text, lang, slow)
+
+
+def _join_audio(clips: List[bytes]) -> bytes:
+    """
+    Join clips produced by `_tts_bytes_uncached` into one playable clip.
+    MP3 frames can simply be concatenated (gTTS does the same internally);
+    WAV clips are re-wrapped under a single header.
+    """
+    clips = [clip for clip in clips if clip]
+    if not clips or not clips[0].startswith(b"RIFF"):
+        return b"".join(clips)
+    out = BytesIO()
+    with wave.open(out, "wb") as joined:
+        for index, clip in enumerate(clips):
+            with wave.open(BytesIO(clip), "rb") as part:
+                if index == 0:
+                    joined.setparams(part.getparams())
+                joined.writeframes(part.readframes(part.getnframes()))
+    return out.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _audio_html(audio_bytes: bytes) -> str:
+    """Hidden autoplaying <audio> element with the clip inlined as a base64 data URL."""
+    b64 = base64.b64encode(audio_bytes).decode("utf-8")
+    mime = "audio/wav" if audio_bytes.startswith(b"RIFF") else "audio/mp3"
+    return _AUDIO_HTML_TEMPLATE.format(mime=mime, b64=b64)
 
 
 def _autoplay_audio(audio_bytes: bytes) -> None:
-    """Autoplay audio in the browser without showing the default player chrome."""
+    """
+    Autoplay audio in the browser without showing the default player chrome.
+    Callers play each turn's clip once (see session_state.audio_for_turn).
+    """
     if not audio_bytes:
         return
-    b64 = base64.b64encode(audio_bytes).decode("utf-8")
-    html = f"""
-    <audio autoplay style="display:none;">
-        <source src="data:audio/mp3;base64,{b64}" type="audio/mp3">
-        Your browser does not support the audio element.
-    </audio>
-    """
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(_audio_html(audio_bytes), unsafe_allow_html=True)
 
 
 def _capture_mic_audio(key: str) -> bytes | None:
@@ -83,24 +245,178 @@ def _capture_mic_audio(key: str) -> bytes | None:
 
 
 def _transcribe_audio_bytes(audio_bytes: bytes) -> str:
-    """Write audio bytes to a temp file and transcribe with Whisper."""
-    tmp_dir = Path(tempfile.gettempdir())
-    ts = int(time.time() * 1000)
-    audio_path = tmp_dir / f"ctrl_hire_streamlit_answer_{ts}.wav"
+    """
+    Transcribe recorded audio bytes with Whisper, decoding them in memory (no temp file).
+    Runs on the background executor, so it must not call Streamlit; Whisper
+    errors are logged and come back as an empty transcript.
+    """
+    return _transcribe_with_whisper(BytesIO(audio_bytes))
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_openrouter_client():
+    """One pooled OpenRouter client shared by every browser session of this server."""
+    return _get_openrouter_client()
+
+
+def _warm_up_whisper() -> None:
+    """Load (and warm up) the Whisper model so the first answer does not pay for it."""
+    try:
+        _get_whisper_model()
+    except Exception:
+        pass
+
+
+def _warm_up_openrouter(client: Any) -> None:
+    """Open the OpenRouter connection so the first question does not pay for it."""
+    try:
+        client.chat.completions.create(
+            model="meta-llama/llama-3.1-8b-instruct",
+            messages=[{"role": "user", "content": "hi"}],
+            max_tokens=1,
+        )
+    except Exception:
+        # Warm-up is an optimization only; real calls report their own errors.
+        pass
 
+
+@st.cache_resource(show_spinner=False)
+def _start_backend_warmup() -> List[threading.Thread]:
+    """
+    Start the background warm-ups once per server process. The Whisper load
+    and the OpenRouter handshake run side by side, so the first question is not
+    queued behind the (much slower) model load.
+    """
+    threads = [
+        threading.Thread(target=_warm_up_whisper, daemon=True),
+        threading.Thread(
+            target=_warm_up_openrouter,
+            args=(_cached_openrouter_client(),),
+            daemon=True,
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+@st.cache_resource(show_spinner=False)
+def _background_executor() -> ThreadPoolExecutor:
+    """Worker pool for LLM calls and transcription, shared by all browser sessions."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="ctrlhire")
+
+
+def _submit_job(key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Run `fn` on the background executor, tracking its future in session_state[key]."""
+    st.session_state[key] = _background_executor().submit(fn, *args, **kwargs)
+
+
+def _await_job(key: str, message: str, retry_phase: str | None = None) -> Any:
+    """
+    Return the result of the job stored in session_state[key] once it is done.
+    While it is still running, show `message` and rerun shortly instead of
+    blocking the script, so the rest of the UI stays responsive.
+    If the job raised and `retry_phase` is given, the error is kept in
+    session_state.job_error and the interview goes back to `retry_phase`,
+    so the user can simply try again.
+    """
+    future = st.session_state[key]
+    if not future.done():
+        st.info(message)
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+    st.session_state[key] = None
     try:
-        with audio_path.open("wb") as f:
-            f.write(audio_bytes)
-        return _transcribe_with_whisper(audio_path)
+        return future.result()
     except Exception as e:
-        st.error(f"Audio transcription failed: {e}")
-        return ""
-    finally:
-        try:
-            if audio_path.exists():
-                audio_path.unlink()
-        except Exception:
-            pass
+        if retry_phase is None:
+            raise
+        st.session_state.job_error = str(e)
+        st.session_state.phase = retry_phase
+        st.rerun()
+
+
+@st.cache_resource(show_spinner=False)
+def _tts_executor() -> ThreadPoolExecutor:
+    """Separate pool for per-sentence TTS, so jobs on the main pool never wait on themselves."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="ctrlhire-tts")
+
+
+def _intro_text(candidate_profile: Dict[str, Any]) -> str:
+    """Spoken greeting that precedes the first question."""
+    return (
+        f"Hello {candidate_profile.get('user_name') or 'there'}. "
+        f"I will be your interviewer for the {candidate_profile.get('target_role') or 'selected'} role. "
+        "Let's get started."
+    )
+
+
+def _stream_question_with_audio(
+    tts_executor: ThreadPoolExecutor,
+    streamed: Dict[str, Any],
+    **question_kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Background job: stream the interviewer's next question, publishing the
+    partial text to streamed["text"] and synthesizing each sentence as soon as
+    it is complete. The concatenated MP3 lands in streamed["audio"], so the
+    question can be spoken the moment the JSON finishes.
+    """
+    sentence_audio: List[Future] = []
+    spoken_upto = 0
+
+    def _on_partial_question(text: str) -> None:
+        nonlocal spoken_upto
+        streamed["text"] = text
+        for match in _SENTENCE_END_RE.finditer(text, spoken_upto):
+            sentence = text[spoken_upto : match.end()].strip()
+            if sentence:
+                sentence_audio.append(tts_executor.submit(_tts_bytes_uncached, sentence))
+            spoken_upto = match.end()
+
+    question_struct = _ask_interviewer_question_stream(
+        on_partial_question=_on_partial_question, **question_kwargs
+    )
+
+    question_text = (question_struct.get("next_question", {}) or {}).get("text", "")
+    try:
+        if question_text and question_text.startswith(streamed.get("text", "")[:spoken_upto]):
+            rest = question_text[spoken_upto:].strip()
+            if rest:
+                sentence_audio.append(tts_executor.submit(_tts_bytes_uncached, rest))
+            streamed["audio"] = _join_audio([f.result() for f in sentence_audio])
+    except Exception:
+        # Fall back to synthesizing the whole question on the script thread.
+        streamed.pop("audio", None)
+    return question_struct
+
+
+def _start_question_job() -> None:
+    """
+    Start generating the interviewer's next question (and its audio) in the background.
+    Called as soon as an answer is recorded, so the question is typically
+    ready by the time the candidate asks for it.
+    """
+    st.session_state.streamed_question = {"text": ""}
+    if not st.session_state.session_data.get("qa_list"):
+        # The greeting does not depend on the question, so synthesize it while
+        # the interviewer LLM is still generating; the cached wrapper lets a
+        # repeated greeting skip the TTS round-trip entirely.
+        st.session_state.streamed_question["intro_audio"] = _tts_executor().submit(
+            _tts_bytes, _intro_text(st.session_state.candidate_profile)
+        )
+    _submit_job(
+        "interview_job",
+        _stream_question_with_audio,
+        _tts_executor(),
+        st.session_state.streamed_question,
+        client=st.session_state.openrouter_client,
+        system_prompt=st.session_state.dynamic_system_prompt,
+        model="meta-llama/llama-3.1-8b-instruct",
+        candidate_profile=st.session_state.candidate_profile,
+        conversation_state={"qa_list": list(st.session_state.conversation_state["qa_list"])},
+        latest_answer=st.session_state.latest_answer_text,
+    )
 
 
 def _init_streamlit_state() -> None:
@@ -108,8 +424,8 @@ def _init_streamlit_state() -> None:
     # First-time initialization
     if "session_initialized" not in st.session_state:
         _ensure_sessions_dir()
-        agents_cfg = _load_yaml(CONFIG_DIR / "agents.yaml")
-        tasks_cfg = _load_yaml(CONFIG_DIR / "tasks.yaml")
+        # Cached in main.py and rebuilt only when the YAML configs change.
+        dynamic_system_prompt, coach_system_prompt = _system_prompts()
 
         st.session_state.session_initialized = True
         st.session_state.candidate_profile: Dict[str, Any] = {}
@@ -119,13 +435,10 @@ def _init_streamlit_state() -> None:
         st.session_state.conversation_state: Dict[str, Any] = {"qa_list": []}
         st.session_state.latest_answer_text: str = ""
         st.session_state.interviewer_persona: str | None = None
-        st.session_state.dynamic_system_prompt: str = _build_dynamic_interview_prompt(
-            agents_cfg, tasks_cfg
-        )
-        st.session_state.coach_system_prompt: str = _build_coach_prompt(
-            agents_cfg, tasks_cfg
-        )
-        st.session_state.openrouter_client = _get_openrouter_client()
+        st.session_state.dynamic_system_prompt: str = dynamic_system_prompt
+        st.session_state.coach_system_prompt: str = coach_system_prompt
+        st.session_state.openrouter_client = _cached_openrouter_client()
+        _start_backend_warmup()
         st.session_state.current_question_struct: Dict[str, Any] | None = None
 
     # Ensure newer keys exist even for older sessions
@@ -137,6 +450,25 @@ def _init_streamlit_state() -> None:
         st.session_state.current_question_text = None
     if "current_end_interview" not in st.session_state:
         st.session_state.current_end_interview = False
+    if "interview_job" not in st.session_state:
+        st.session_state.interview_job = None
+    if "coach_job" not in st.session_state:
+        st.session_state.coach_job = None
+        st.session_state.coach_job_key = None
+    if "coach_feedback_key" not in st.session_state:
+        st.session_state.coach_feedback_key = None
+    if "streamed_coach" not in st.session_state:
+        st.session_state.streamed_coach = {"summary": ""}
+    if "last_audio_digest" not in st.session_state:
+        st.session_state.last_audio_digest = None
+    if "audio_for_turn" not in st.session_state:
+        st.session_state.audio_for_turn = None
+    if "job_error" not in st.session_state:
+        st.session_state.job_error = None
+    if "pending_code_answer" not in st.session_state:
+        st.session_state.pending_code_answer = None
+    if "streamed_question" not in st.session_state:
+        st.session_state.streamed_question = {"text": ""}
 
 
 def _start_new_session(
@@ -149,7 +481,7 @@ def _start_new_session(
 ) -> None:
     """Create a new JSON session file and reset state."""
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in user_name)
+    safe_name = _safe_session_name(user_name)
     session_filename = f"{safe_name or 'candidate'}_{timestamp}.json"
     session_path = SESSIONS_DIR / session_filename
 
@@ -170,8 +502,7 @@ def _start_new_session(
         "created_at_utc": timestamp,
     }
 
-    with session_path.open("w", encoding="utf-8") as f:
-        json.dump(session_data, f, ensure_ascii=False, indent=2)
+    _write_session_json(session_path, session_data)
 
     st.session_state.candidate_profile = candidate_profile
     st.session_state.feedback_mode = feedback_mode
@@ -186,25 +517,44 @@ def _start_new_session(
     st.session_state.current_question_text = None
     st.session_state.current_end_interview = False
     st.session_state.answer_processed = False
-
-
-def _append_qa_to_session(question_text: str, round_label: str, answer_text: str) -> None:
-    """Append a Q&A pair to the JSON session file and update state."""
+    st.session_state.interview_job = None
+    st.session_state.job_error = None
+    st.session_state.coach_job = None
+    st.session_state.coach_job_key = None
+    st.session_state.coach_feedback_key = None
+    st.session_state.last_audio_digest = None
+    st.session_state.audio_for_turn = None
+
+
+def _append_qa_to_session(
+    question_text: str,
+    round_label: str,
+    answer_text: str,
+    technical_evaluation: Dict[str, Any] | None = None,
+) -> None:
+    """
+    Append a Q&A pair to the session's JSONL turn log and update state.
+    Only the new line is written; the full JSON is rewritten when the
+    interview ends and when coach feedback is generated.
+    """
     if st.session_state.session_path is None:
         return
 
-    qa_entry = {
+    qa_entry: Dict[str, Any] = {
         "turn": len(st.session_state.session_data.get("qa_list", [])) + 1,
         "round": round_label,
         "question": question_text,
         "answer_text": answer_text,
     }
+    if technical_evaluation is not None:
+        qa_entry["technical_evaluation"] = technical_evaluation
 
     st.session_state.session_data.setdefault("qa_list", []).append(qa_entry)
     st.session_state.conversation_state["qa_list"] = st.session_state.session_data["qa_list"]
 
-    with st.session_state.session_path.open("w", encoding="utf-8") as f:
-        json.dump(st.session_state.session_data, f, ensure_ascii=False, indent=2)
+    _append_session_turn(st.session_state.session_path, qa_entry)
+    if st.session_state.current_end_interview:
+        _write_session_json(st.session_state.session_path, st.session_state.session_data)
 
 
 def main() -> None:
@@ -212,53 +562,7 @@ def main() -> None:
 
     _init_streamlit_state()
 
-    # Global styling to give the app a more eye-catching, modern look.
-    st.markdown(
-        """
-        <style>
-        /* Overall app background */
-        .stApp {
-            background: radial-gradient(circle at top left, #020617 0, #020617 35%, #020617 40%, #020617 60%, #020617 100%);
-            background-color: #020617;
-        }
-
-        /* Sidebar */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #020617 0%, #111827 50%, #020617 100%);
-            border-right: 1px solid rgba(148, 163, 184, 0.25);
-        }
-
-        /* Headings */
-        h2, h3, h4 {
-            color: #e5e7eb !important;
-        }
-
-        /* Cards / containers */
-        .ctrlhire-card {
-            background: radial-gradient(circle at top left, #4f46e5 0%, #0f172a 55%, #020617 100%);
-            border-radius: 1.25rem;
-            padding: 2rem 1.75rem;
-            box-shadow: 0 24px 60px rgba(15, 23, 42, 0.85);
-            border: 1px solid rgba(129, 140, 248, 0.45);
-        }
-
-        .ctrlhire-hero-title {
-            font-size: 2.1rem;
-            font-weight: 700;
-            letter-spacing: 0.03em;
-            color: #f9fafb;
-            margin-bottom: 0.25rem;
-        }
-
-        .ctrlhire-hero-subtitle {
-            color: #cbd5f5;
-            font-size: 0.98rem;
-            max-width: 46rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
 
     # Sidebar navigation (single source of truth is 'nav_radio' in session_state)
     pages = ["🏠 Home", "🎙️ Interview", "🧠 Coach", "📊 Session log"]
@@ -274,21 +578,7 @@ def main() -> None:
     # --------------- HOME / SETUP PAGE -----------------
     if nav == "🏠 Home":
         # Hero section / landing feel
-        st.markdown(
-            """
-            <div class="ctrlhire-card" style="margin-bottom: 1.75rem;">
-              <div class="ctrlhire-hero-title">Ctrl+Hire</div>
-              <p class="ctrlhire-hero-subtitle" style="margin-bottom: 0.85rem;">
-                A modern, voice‑first studio to rehearse tough interviews with an AI that actually feels like the hiring panel.
-              </p>
-              <p class="ctrlhire-hero-subtitle" style="opacity: 0.9;">
-                JD‑aware questions, built‑in code pads for DSA / SQL, and a performance coach that explains
-                <strong>what you did well</strong> and <strong>what to sharpen next</strong> — all in one place.
-              </p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
         st.markdown("### Tell us about the interview you want to practice")
         col_left, col_right = st.columns(2)
@@ -377,6 +667,27 @@ def main() -> None:
     if nav == "🎙️ Interview":
         st.markdown("### Interviewer")
 
+        # Phase: waiting for the technical evaluation of a submitted code answer
+        if st.session_state.phase == "awaiting_evaluation":
+            tech_eval = _await_job("interview_job", "Checking your code answer...")
+            # The turn is logged only now, so its JSONL line includes the evaluation.
+            _append_qa_to_session(
+                **st.session_state.pending_code_answer, technical_evaluation=tech_eval
+            )
+            st.session_state.pending_code_answer = None
+
+            verdict = tech_eval.get("short_verdict")
+            if verdict:
+                st.markdown(f"**Technical check:** {verdict}")
+
+            st.success("Code answer submitted.")
+            if st.session_state.current_end_interview:
+                st.session_state.phase = "finished"
+                st.info("Interviewer has concluded the interview. You can now request feedback below.")
+            else:
+                st.session_state.phase = "await_next"
+                _start_question_job()
+
         # Phase: interviewer introduction + asking for consent to start / continue
         if st.session_state.phase in ("await_consent", "await_next"):
             if st.session_state.phase == "await_consent":
@@ -388,6 +699,12 @@ def main() -> None:
                     "When you're ready for the next question, click the button below."
                 )
             st.markdown(f"**{prompt_text}**")
+            if st.session_state.job_error:
+                st.error(
+                    f"Your interviewer could not prepare the question ({st.session_state.job_error}). "
+                    "Click the button below to try again."
+                )
+                st.session_state.job_error = None
 
             label = (
                 "I'm ready to start the interview"
@@ -396,52 +713,97 @@ def main() -> None:
             )
 
             if st.button(label):
-                client = st.session_state.openrouter_client
-                question_struct = _ask_interviewer_question(
-                    client=client,
-                    system_prompt=st.session_state.dynamic_system_prompt,
-                    model="meta-llama/llama-3.1-8b-instruct",
-                    candidate_profile=st.session_state.candidate_profile,
-                    conversation_state=st.session_state.conversation_state,
-                    latest_answer=st.session_state.latest_answer_text,
-                )
-
-                st.session_state.current_question_struct = question_struct
-
-                persona = question_struct.get("persona")
-                first_turn = not st.session_state.session_data.get("qa_list")
-
-                if persona and not st.session_state.interviewer_persona:
-                    st.session_state.interviewer_persona = persona
-                    st.session_state.session_data["interviewer_persona"] = persona
-                    st.write(f"**Interviewer Persona:** {persona}")
-
-                next_round = question_struct.get("next_round", "unknown")
-                next_question_obj = question_struct.get("next_question", {}) or {}
-                question_text = next_question_obj.get("text", "Please answer this question.")
-                end_interview = bool(question_struct.get("end_interview", False))
-
-                st.session_state.current_round = next_round
-                st.session_state.current_question_text = question_text
-                st.session_state.current_end_interview = end_interview
-                st.session_state.phase = "await_answer"
+                # After an answer the next question is usually already being prefetched.
+                if st.session_state.interview_job is None:
+                    _start_question_job()
+                st.session_state.phase = "awaiting_question"
+                st.rerun()
+
+        # Phase: waiting for the interviewer LLM to produce the next question
+        if st.session_state.phase == "awaiting_question":
+            if st.session_state.interview_job is None:
+                _start_question_job()
+            streamed = st.session_state.streamed_question
+            if not st.session_state.interview_job.done() and streamed["text"]:
+                st.image(BOT_AVATAR_URL, width=96)
+                st.markdown(f"**Question:** {streamed['text']}▌")
+            question_struct = _await_job(
+                "interview_job",
+                "Your interviewer is preparing the question...",
+                retry_phase="await_next" if st.session_state.session_data.get("qa_list") else "await_consent",
+            )
 
-                # Voice first, then show text + bot avatar.
+            st.session_state.current_question_struct = question_struct
+
+            persona = question_struct.get("persona")
+            first_turn = not st.session_state.session_data.get("qa_list")
+
+            if persona and not st.session_state.interviewer_persona:
+                st.session_state.interviewer_persona = persona
+                st.session_state.session_data["interviewer_persona"] = persona
+                # Persist the persona with the session metadata right away: the JSON is
+                # otherwise only rewritten at the end, and turns live in the JSONL log.
+                if not st.session_state.session_data.get("qa_list"):
+                    _write_session_json(st.session_state.session_path, st.session_state.session_data)
+                st.write(f"**Interviewer Persona:** {persona}")
+
+            next_round = question_struct.get("next_round", "unknown")
+            next_question_obj = question_struct.get("next_question", {}) or {}
+            question_text = next_question_obj.get("text", "Please answer this question.")
+            end_interview = bool(question_struct.get("end_interview", False))
+
+            st.session_state.current_round = next_round
+            st.session_state.current_question_text = question_text
+            st.session_state.current_end_interview = end_interview
+            st.session_state.phase = "await_answer"
+
+            # Voice first, then show text + bot avatar. Each turn's question is
+            # synthesized and played at most once, however often this code re-runs.
+            current_turn = len(st.session_state.session_data.get("qa_list", [])) + 1
+            if st.session_state.audio_for_turn != current_turn:
+                st.session_state.audio_for_turn = current_turn
                 if first_turn and persona:
-                    intro_and_question = (
-                        f"Hello {st.session_state.candidate_profile.get('user_name') or 'there'}. "
-                        f"I will be your interviewer for the {st.session_state.candidate_profile.get('target_role') or 'selected'} role. "
-                        "Let's get started. "
-                        + question_text
-                    )
-                    audio_bytes = _tts_bytes(intro_and_question)
+                    # Synthesize intro and question separately and join the clips.
+                    question_audio = streamed.get("audio") or _tts_bytes(question_text)
+                    intro_job = streamed.get("intro_audio")
+                    try:
+                        intro_audio = intro_job.result() if intro_job is not None else b""
+                    except Exception:
+                        intro_audio = b""
+                    intro_audio = intro_audio or _tts_bytes(_intro_text(st.session_state.candidate_profile))
+                    audio_bytes = _join_audio([intro_audio, question_audio])
                     _autoplay_audio(audio_bytes)
                 else:
-                    question_audio = _tts_bytes(question_text)
+                    question_audio = streamed.get("audio") or _tts_bytes(question_text)
                     _autoplay_audio(question_audio)
 
-                st.image(BOT_AVATAR_URL, width=96)
-                st.markdown(f"**Question:** {question_text}")
+            st.image(BOT_AVATAR_URL, width=96)
+            st.markdown(f"**Question:** {question_text}")
+
+        # Phase: waiting for Whisper to transcribe a recorded answer
+        if st.session_state.phase == "awaiting_transcription":
+            answer_text = (_await_job("interview_job", "Transcribing your answer...") or "").strip()
+            if answer_text:
+                st.session_state.latest_answer_text = answer_text
+                _append_qa_to_session(
+                    question_text=st.session_state.current_question_text,
+                    round_label=st.session_state.current_round,
+                    answer_text=answer_text,
+                )
+                st.success("Answer submitted from your recording.")
+                st.session_state.current_question_text = None
+
+                if st.session_state.current_end_interview:
+                    st.session_state.phase = "finished"
+                    st.info("Interviewer has concluded the interview. You can now request feedback below.")
+                else:
+                    st.session_state.phase = "await_next"
+                    _start_question_job()
+
+                st.rerun()
+            else:
+                st.session_state.phase = "await_answer"
+                st.info("We couldn't understand the recording. You can try again or type your answer below.")
 
         # Phase: waiting for the user's answer
         if nav == "🎙️ Interview" and st.session_state.phase == "await_answer" and st.session_state.current_question_text:
@@ -484,14 +846,16 @@ def main() -> None:
                         return
 
                     st.session_state.latest_answer_text = answer_text
-                    _append_qa_to_session(
-                        question_text=st.session_state.current_question_text,
-                        round_label=st.session_state.current_round,
-                        answer_text=answer_text,
-                    )
+                    st.session_state.pending_code_answer = {
+                        "question_text": st.session_state.current_question_text,
+                        "round_label": st.session_state.current_round,
+                        "answer_text": answer_text,
+                    }
 
                     tech_role_hint = f"{st.session_state.candidate_profile.get('target_role','')} @ {st.session_state.candidate_profile.get('company_type','')}"
-                    tech_eval = _evaluate_technical_answer(
+                    _submit_job(
+                        "interview_job",
+                        _evaluate_technical_answer,
                         client=st.session_state.openrouter_client,
                         system_prompt_role=tech_role_hint,
                         model="meta-llama/llama-3.1-8b-instruct",
@@ -501,30 +865,8 @@ def main() -> None:
                         question_type=question_type,
                         skill_tags=skill_tags,
                     )
-                    if st.session_state.session_data.get("qa_list"):
-                        st.session_state.session_data["qa_list"][-1]["technical_evaluation"] = tech_eval
-                        if st.session_state.session_path is not None:
-                            with st.session_state.session_path.open("w", encoding="utf-8") as f:
-                                json.dump(
-                                    st.session_state.session_data,
-                                    f,
-                                    ensure_ascii=False,
-                                    indent=2,
-                                )
-
-                    verdict = tech_eval.get("short_verdict")
-                    if verdict:
-                        st.markdown(f"**Technical check:** {verdict}")
-
-                    st.success("Code answer submitted.")
                     st.session_state.current_question_text = None
-
-                    if st.session_state.current_end_interview:
-                        st.session_state.phase = "finished"
-                        st.info("Interviewer has concluded the interview. You can now request feedback below.")
-                    else:
-                        st.session_state.phase = "await_next"
-
+                    st.session_state.phase = "awaiting_evaluation"
                     st.rerun()
             else:
                 st.subheader("Your Answer")
@@ -533,27 +875,16 @@ def main() -> None:
                 audio_bytes = _capture_mic_audio(
                     key=f"answer_mic_turn_{len(st.session_state.session_data.get('qa_list', [])) + 1}"
                 )
-                if audio_bytes:
-                    answer_text = _transcribe_audio_bytes(audio_bytes).strip()
-                    if answer_text:
-                        st.session_state.latest_answer_text = answer_text
-                        _append_qa_to_session(
-                            question_text=st.session_state.current_question_text,
-                            round_label=st.session_state.current_round,
-                            answer_text=answer_text,
-                        )
-                        st.success("Answer submitted from your recording.")
-                        st.session_state.current_question_text = None
-
-                        if st.session_state.current_end_interview:
-                            st.session_state.phase = "finished"
-                            st.info("Interviewer has concluded the interview. You can now request feedback below.")
-                        else:
-                            st.session_state.phase = "await_next"
-
-                        st.rerun()
-                    else:
-                        st.info("We couldn't understand the recording. You can try again or type your answer below.")
+                # The recorder keeps returning its last clip on every rerun; only transcribe new ones.
+                # A 16-byte digest is all that needs to live in session_state, not the clip itself.
+                audio_digest = (
+                    hashlib.blake2b(audio_bytes, digest_size=16).digest() if audio_bytes else None
+                )
+                if audio_digest is not None and audio_digest != st.session_state.last_audio_digest:
+                    st.session_state.last_audio_digest = audio_digest
+                    _submit_job("interview_job", _transcribe_audio_bytes, audio_bytes)
+                    st.session_state.phase = "awaiting_transcription"
+                    st.rerun()
 
                 # 2) Optional typed answer (fallback)
                 typed_answer = st.text_area("Or type your answer here")
@@ -579,6 +910,7 @@ def main() -> None:
                         st.info("Interviewer has concluded the interview. You can now request feedback below.")
                     else:
                         st.session_state.phase = "await_next"
+                        _start_question_job()
 
     # --------------- COACH PAGE -----------------
     if nav == "🧠 Coach":
@@ -587,20 +919,45 @@ def main() -> None:
         if not qa_list:
             st.warning("No Q&A data available yet.")
         else:
-            client = st.session_state.openrouter_client
-            feedback = _analyze_with_coach(
-                client=client,
-                system_prompt=st.session_state.coach_system_prompt,
-                model="meta-llama/llama-3.1-8b-instruct",
-                candidate_profile=st.session_state.candidate_profile,
-                qa_list=qa_list,
-                feedback_mode=st.session_state.feedback_mode,
-            )
-
-            st.session_state.session_data["coach_feedback"] = feedback
-            if st.session_state.session_path is not None:
-                with st.session_state.session_path.open("w", encoding="utf-8") as f:
-                    json.dump(st.session_state.session_data, f, ensure_ascii=False, indent=2)
+            # Feedback only changes when the profile, answers or mode do; reuse it otherwise.
+            coach_key = hashlib.blake2b(
+                orjson.dumps(
+                    [st.session_state.candidate_profile, qa_list, st.session_state.feedback_mode]
+                ),
+                digest_size=16,
+            ).digest()
+            if (
+                st.session_state.coach_feedback_key == coach_key
+                and "coach_feedback" in st.session_state.session_data
+            ):
+                feedback = st.session_state.session_data["coach_feedback"]
+            else:
+                if st.session_state.coach_job is None:
+                    st.session_state.coach_job_key = coach_key
+                    streamed_coach: Dict[str, str] = {"summary": ""}
+                    st.session_state.streamed_coach = streamed_coach
+                    _submit_job(
+                        "coach_job",
+                        _analyze_with_coach_stream,
+                        client=st.session_state.openrouter_client,
+                        system_prompt=st.session_state.coach_system_prompt,
+                        model="meta-llama/llama-3.1-8b-instruct",
+                        candidate_profile=st.session_state.candidate_profile,
+                        qa_list=list(qa_list),
+                        feedback_mode=st.session_state.feedback_mode,
+                        on_partial_summary=lambda text: streamed_coach.update(summary=text),
+                    )
+                # Show the summary as it streams in while the rest of the feedback is generated.
+                partial_summary = st.session_state.streamed_coach["summary"]
+                if partial_summary and not st.session_state.coach_job.done():
+                    st.markdown("#### Overall summary")
+                    st.write(partial_summary + "▌")
+                feedback = _await_job("coach_job", "Your coach is reviewing the interview...")
+                st.session_state.coach_feedback_key = st.session_state.coach_job_key
+
+                st.session_state.session_data["coach_feedback"] = feedback
+                if st.session_state.session_path is not None:
+                    _write_session_json(st.session_state.session_path, st.session_state.session_data)
 
             st.success("Coach feedback generated.")
 
@@ -622,48 +979,54 @@ def main() -> None:
 
             if scores:
                 st.markdown("#### Scores (1–5)")
-                cols = st.columns(len(scores))
-                for (name, value), col in zip(scores.items(), cols):
-                    with col:
-                        col.metric(label=name.replace("_", " ").title(), value=str(value))
+                scores_df = pd.DataFrame(
+                    {
+                        "dimension": [name.replace("_", " ").title() for name in scores],
+                        "score": [str(value) for value in scores.values()],
+                    }
+                )
+                st.dataframe(scores_df, hide_index=True)
 
+            # One markdown element per section rather than one per bullet.
             col_left, col_right = st.columns(2)
             with col_left:
                 if strengths:
-                    st.markdown("#### Strengths")
-                    for item in strengths:
-                        st.markdown(f"- {item}")
+                    st.markdown("#### Strengths\n" + "\n".join(f"- {item}" for item in strengths))
             with col_right:
                 if improvements:
-                    st.markdown("#### Improvement areas")
-                    for item in improvements:
-                        st.markdown(f"- {item}")
+                    st.markdown(
+                        "#### Improvement areas\n" + "\n".join(f"- {item}" for item in improvements)
+                    )
 
             if inferred_skills:
-                st.markdown("#### Inferred technical strengths")
-                st.write(
-                    "Based on your project and role-specific answers, the coach believes you show strength in:"
+                st.markdown(
+                    "#### Inferred technical strengths\n"
+                    "Based on your project and role-specific answers, the coach believes you show strength in:\n\n"
+                    + "\n".join(f"- {skill}" for skill in inferred_skills)
                 )
-                for skill in inferred_skills:
-                    st.markdown(f"- {skill}")
 
             if improved_answers:
-                st.markdown("#### Example improved answers for technical questions")
+                blocks = []
                 for idx, item in enumerate(improved_answers, start=1):
                     question = item.get("question", "").strip()
                     improved = item.get("improved_answer", "").strip()
                     if not improved:
                         continue
-                    st.markdown(f"**Problem {idx}:** {question}")
-                    st.markdown(improved)
+                    blocks.append(f"**Problem {idx}:** {question}\n\n{improved}")
+                if blocks:
+                    st.markdown(
+                        "#### Example improved answers for technical questions\n\n"
+                        + "\n\n".join(blocks)
+                    )
 
             if per_round:
-                st.markdown("#### Round-by-round notes")
-                for round_name, note in per_round.items():
-                    if not note:
-                        continue
-                    st.markdown(f"**{round_name.replace('_', ' ').title()}**")
-                    st.write(note)
+                notes = [
+                    f"**{round_name.replace('_', ' ').title()}**\n\n{note}"
+                    for round_name, note in per_round.items()
+                    if note
+                ]
+                if notes:
+                    st.markdown("#### Round-by-round notes\n\n" + "\n\n".join(notes))
 
         return
 
@@ -675,15 +1038,18 @@ def main() -> None:
             st.info("No questions have been asked yet in this session.")
         else:
             st.write(f"Total questions answered: **{len(qa_list)}**")
-            st.table(
-                [
-                    {
-                        "Turn": qa.get("turn"),
-                        "Round": qa.get("round"),
-                        "Question": qa.get("question"),
-                    }
-                    for qa in qa_list
-                ]
+            # Built straight from qa_list; st.dataframe only renders visible rows.
+            qa_df = pd.DataFrame(qa_list, columns=["turn", "round", "question"]).rename(
+                columns={"turn": "Turn", "round": "Round", "question": "Question"}
+            )
+            st.dataframe(qa_df, use_container_width=True, hide_index=True)
+
+            # Full snapshot of the session, including turns so far only in the JSONL log.
+            st.download_button(
+                "Export session (JSON)",
+                data=orjson.dumps(st.session_state.session_data, option=orjson.OPT_INDENT_2),
+                file_name=st.session_state.session_path.name,
+                mime="application/json",
             )
 
         if "coach_feedback" in st.session_state.session_data:
@@ -0,0 +1,119 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from voice_interview_practice_system.main import (
+    _JsonStreamCollector,
+    _PARTIAL_QUESTION_TEXT_RE,
+    _PARTIAL_SUMMARY_RE,
+)
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def _stream(collector, text, size):
+    for start in range(0, len(text), size):
+        collector.feed(_chunk(text[start : start + size]))
+
+
+def _question_json(text, skill_tags=None):
+    return json.dumps(
+        {
+            "persona": "Alex",
+            "next_round": "technical",
+            "next_question": {
+                "question_type": "coding",
+                "skill_tags": skill_tags or ["dsa"],
+                "text": text,
+            },
+            "end_interview": False,
+        }
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", range(1, 9))
+def test_question_text_survives_any_chunk_split(size):
+    question = 'Say "hi" \\ then\nwrite café ✓ code.'
+    content = _question_json(question)
+    partials, completed = [], []
+    collector = _JsonStreamCollector(
+        _PARTIAL_QUESTION_TEXT_RE, on_partial=partials.append, on_complete=completed.append
+    )
+
+    _stream(collector, content, size)
+
+    assert collector.content == content
+    assert completed == [question]
+    assert partials[-1] == question
+    # A split escape sequence is dropped until it is complete, never decoded half-way.
+    assert all(question.startswith(partial) for partial in partials)
+
+
+@pytest.mark.unit
+def test_unicode_escape_split_at_every_position():
+    content = _question_json("café")
+    assert "\\u00e9" in content
+    escape_at = content.index("\\u00e9")
+    for cut in range(escape_at, escape_at + 6):
+        partials, completed = [], []
+        collector = _JsonStreamCollector(
+            _PARTIAL_QUESTION_TEXT_RE, on_partial=partials.append, on_complete=completed.append
+        )
+        collector.feed(_chunk(content[:cut]))
+        assert partials == ["caf"]
+        collector.feed(_chunk(content[cut:]))
+        assert partials == ["caf", "café"]
+        assert completed == ["café"]
+
+
+@pytest.mark.unit
+def test_complete_is_reported_once_and_only_after_closing_quote():
+    completed = []
+    collector = _JsonStreamCollector(_PARTIAL_QUESTION_TEXT_RE, on_complete=completed.append)
+
+    collector.feed(_chunk('{"next_question": {"text": "Why'))
+    assert completed == []
+    collector.feed(_chunk(' Kafka?'))
+    assert completed == []
+    collector.feed(_chunk('"}, "end_interview": false}'))
+    collector.feed(_chunk(" "))
+    assert completed == ["Why Kafka?"]
+
+
+@pytest.mark.unit
+def test_text_in_skill_tags_is_not_mistaken_for_the_question():
+    content = _question_json("Explain B-trees.", skill_tags=["text", "databases"])
+    completed = []
+    collector = _JsonStreamCollector(_PARTIAL_QUESTION_TEXT_RE, on_complete=completed.append)
+
+    _stream(collector, content, 3)
+
+    assert completed == ["Explain B-trees."]
+
+
+@pytest.mark.unit
+def test_chunks_without_content_are_ignored():
+    collector = _JsonStreamCollector(_PARTIAL_SUMMARY_RE)
+
+    collector.feed(SimpleNamespace(choices=[]))
+    collector.feed(_chunk(None))
+    collector.feed(_chunk(""))
+    collector.feed(_chunk('{"overall_summary": "ok"}'))
+
+    assert collector.content == '{"overall_summary": "ok"}'
+
+
+@pytest.mark.unit
+def test_coach_summary_streams_partially():
+    content = json.dumps({"overall_summary": "Clear, structured answers.", "strengths": []})
+    partials = []
+    collector = _JsonStreamCollector(_PARTIAL_SUMMARY_RE, on_partial=partials.append)
+
+    _stream(collector, content, 4)
+
+    assert partials[-1] == "Clear, structured answers."
+    assert len(partials) > 1
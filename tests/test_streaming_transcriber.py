@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import voice_interview_practice_system.main as main
+from voice_interview_practice_system.main import _StreamingTranscriber
+
+SAMPLE_RATE = 16_000
+
+
+def _transcriber_with(hypotheses, seconds=3.0):
+    """A transcriber holding `seconds` of audio whose decodes return `hypotheses` in turn."""
+    transcriber = _StreamingTranscriber(sample_rate=SAMPLE_RATE)
+    transcriber._buffer = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    decodes = iter(hypotheses)
+    transcriber._decode_buffer = lambda: next(decodes)
+    return transcriber
+
+
+@pytest.mark.unit
+def test_first_pass_commits_nothing():
+    transcriber = _transcriber_with([[(0.5, "Hello"), (1.0, "world")]])
+
+    transcriber._step()
+
+    assert transcriber._committed == []
+    assert transcriber._previous == ["Hello", "world"]
+    assert len(transcriber._buffer) == 3 * SAMPLE_RATE
+
+
+@pytest.mark.unit
+def test_agreed_prefix_is_committed_and_trimmed_from_the_buffer():
+    transcriber = _transcriber_with(
+        [
+            [(0.5, "Hello"), (1.0, "world"), (1.4, "it's")],
+            # Case and punctuation differences still count as agreement.
+            [(0.5, "hello,"), (1.0, "World"), (1.5, "is"), (2.0, "me")],
+        ]
+    )
+    original = transcriber._buffer.copy()
+
+    transcriber._step()
+    transcriber._step()
+
+    assert transcriber._committed == ["hello,", "World"]
+    assert transcriber._previous == ["is", "me"]
+    # Audio up to the end of the last committed word is dropped.
+    np.testing.assert_array_equal(transcriber._buffer, original[SAMPLE_RATE:])
+
+
+@pytest.mark.unit
+def test_later_passes_compare_against_the_uncommitted_tail_only():
+    transcriber = _transcriber_with(
+        [
+            [(0.5, "one"), (1.0, "two")],
+            [(0.5, "one"), (1.0, "three")],
+            # Timestamps are relative to the trimmed buffer now.
+            [(0.5, "three"), (1.0, "four")],
+        ]
+    )
+
+    transcriber._step()
+    transcriber._step()
+    assert transcriber._committed == ["one"]
+    assert transcriber._previous == ["three"]
+
+    transcriber._step()
+    assert transcriber._committed == ["one", "three"]
+    assert transcriber._previous == ["four"]
+    assert len(transcriber._buffer) == int(2.0 * SAMPLE_RATE)
+
+
+@pytest.mark.unit
+def test_step_waits_for_a_second_of_audio():
+    transcriber = _transcriber_with([], seconds=0.5)
+
+    # The stubbed decoder has nothing to return, so a decode would raise StopIteration.
+    transcriber._step()
+
+    assert transcriber._committed == []
+
+
+@pytest.mark.unit
+def test_fed_int16_frames_are_scaled_into_the_buffer():
+    transcriber = _StreamingTranscriber(sample_rate=SAMPLE_RATE)
+
+    transcriber.feed(np.full(320, 16_384, dtype=np.int16))
+    transcriber.feed(np.full(320, -32_768, dtype=np.int16))
+    transcriber._drain_pending()
+
+    assert transcriber._buffer.dtype == np.float32
+    np.testing.assert_allclose(transcriber._buffer[:320], 0.5)
+    np.testing.assert_allclose(transcriber._buffer[320:], -1.0)
+
+
+@pytest.mark.unit
+def test_finish_appends_the_decoded_tail(monkeypatch):
+    tail_model = SimpleNamespace(
+        transcribe=lambda audio, **kwargs: ([SimpleNamespace(text=" again")], None)
+    )
+    monkeypatch.setattr(main, "_get_whisper_model", lambda: tail_model)
+    transcriber = _StreamingTranscriber(sample_rate=SAMPLE_RATE, interval_seconds=60)
+    transcriber._committed = ["hello", "world"]
+    transcriber._buffer = np.zeros(SAMPLE_RATE // 2, dtype=np.float32)
+    transcriber.start()
+
+    assert transcriber.finish() == "hello world again"